@@ -1,14 +1,19 @@
 """Abstract base classes for tools and providers."""
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable, Hashable
 from typing import Any, ClassVar, Generic, TypeVar
 
 import httpx
 from pydantic import BaseModel
 
+from ultra_search.core.cache import TTLCache
+
 # Type variables for generic tool typing
 InputT = TypeVar("InputT", bound=BaseModel)
 OutputT = TypeVar("OutputT", bound=BaseModel)
+ResultT = TypeVar("ResultT")
 
 
 class BaseTool(ABC, Generic[InputT, OutputT]):
@@ -48,7 +53,73 @@ class BaseTool(ABC, Generic[InputT, OutputT]):
         return self.input_model.model_json_schema()
 
 
-class BaseProvider(ABC):
+class CachedRequestMixin:
+    """Response cache and request coalescing shared by provider base classes.
+
+    Subclasses must call super().__init__() to set up the cache.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[Hashable, asyncio.Future[Any]] = {}
+        self._response_cache = TTLCache()
+
+    async def _coalesce(
+        self,
+        key: Hashable,
+        factory: Callable[[], Awaitable[ResultT]],
+    ) -> ResultT:
+        """Share one in-flight request between concurrent identical callers.
+
+        The first caller for a key starts ``factory()``; callers arriving
+        while it is still running await the same result instead of issuing
+        their own request.
+
+        Args:
+            key: Hashable identity of the request
+            factory: Zero-argument callable returning the request awaitable
+
+        Returns:
+            Result of the shared request
+        """
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(future)
+
+    async def _cached_request(
+        self,
+        key: Hashable,
+        ttl: float,
+        factory: Callable[[], Awaitable[ResultT]],
+        copy_result: Callable[[ResultT], ResultT] | None = None,
+    ) -> ResultT:
+        """Serve a request from the response cache, fetching on miss.
+
+        Misses go through _coalesce, so concurrent misses for the same key
+        still issue a single upstream request.
+
+        Args:
+            key: Cache key, conventionally "{domain}:{kind}:{identifier}"
+            ttl: Seconds to keep the response; 0 disables caching
+            factory: Zero-argument callable returning the request awaitable
+            copy_result: Applied to the shared result before it is returned,
+                so callers that mutate results don't affect each other
+
+        Returns:
+            Cached or freshly fetched result
+        """
+        result = self._response_cache.get(key)
+        if result is None:
+            result = await self._coalesce(key, factory)
+            if ttl > 0:
+                self._response_cache.set(key, result, ttl)
+
+        return result if copy_result is None else copy_result(result)
+
+
+class BaseProvider(CachedRequestMixin, ABC):
     """Abstract base class for API providers.
 
     Providers handle the actual API communication for a domain.
@@ -66,6 +137,7 @@ class BaseProvider(ABC):
             api_key: API key for authentication
             **kwargs: Additional provider-specific configuration
         """
+        super().__init__()
         self.api_key = api_key
         self._client: httpx.AsyncClient | None = None
 
@@ -103,7 +175,8 @@ class BaseProvider(ABC):
         pass
 
     async def close(self) -> None:
-        """Close the HTTP client."""
+        """Close the HTTP client and drop cached responses."""
+        self._response_cache.clear()
         if self._client is not None:
             await self._client.aclose()
             self._client = None
@@ -0,0 +1,174 @@
+"""Response caches for provider lookups.
+
+This module provides:
+- TTLCache: In-memory LRU cache with per-entry expiry
+- DiskCache: SQLite-backed key/value cache that survives process restarts
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from pathlib import Path
+from typing import Any
+
+
+class TTLCache:
+    """In-memory LRU cache with per-entry expiry.
+
+    Not thread-safe; intended for use from a single event loop, where
+    get/set never yield and so need no locking.
+    """
+
+    def __init__(self, maxsize: int = 512, default_ttl: float = 300.0):
+        """Initialize cache.
+
+        Args:
+            maxsize: Maximum number of entries before least-recently-used eviction
+            default_ttl: Default entry lifetime in seconds
+        """
+        self.maxsize = maxsize
+        self.default_ttl = default_ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any | None:
+        """Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None if missing or expired
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        """Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Entry lifetime in seconds. Uses default_ttl if None.
+        """
+        expires_at = time.monotonic() + (self.default_ttl if ttl is None else ttl)
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class DiskCache:
+    """SQLite-backed cache with per-entry expiry.
+
+    Values are stored as JSON text, so anything returned by an API's
+    ``response.json()`` round-trips unchanged.
+
+    Every method blocks on disk I/O; async callers should run them via
+    ``asyncio.to_thread``. A lock serializes access, so concurrent worker
+    threads can share one instance.
+    """
+
+    def __init__(self, db_path: str | Path, default_ttl: float = 86400.0):
+        """Initialize disk cache.
+
+        Args:
+            db_path: Path to SQLite database file
+            default_ttl: Default entry lifetime in seconds
+        """
+        self.db_path = Path(db_path)
+        self.default_ttl = default_ttl
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _get_conn(self) -> sqlite3.Connection:
+        """Open the database on first use and drop expired entries.
+
+        Callers must hold self._lock.
+        """
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+            """
+            )
+            self._conn.execute("DELETE FROM cache WHERE expires_at <= ?", (time.time(),))
+            self._conn.commit()
+        return self._conn
+
+    def get(self, key: str) -> Any | None:
+        """Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None if missing or expired
+        """
+        with self._lock:
+            row = self._get_conn().execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+
+        if row is None or row[1] <= time.time():
+            return None
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """Store a value.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+            ttl: Entry lifetime in seconds. Uses default_ttl if None.
+        """
+        expires_at = time.time() + (self.default_ttl if ttl is None else ttl)
+        encoded = json.dumps(value)
+        with self._lock:
+            conn = self._get_conn()
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, encoded, expires_at),
+            )
+            conn.commit()
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            conn = self._get_conn()
+            conn.execute("DELETE FROM cache")
+            conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
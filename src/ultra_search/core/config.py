@@ -91,6 +91,9 @@ class Settings(BaseSettings):
     default_timeout: float = 30.0
     retry_attempts: int = 3
 
+    # Indent tool results returned over MCP; compact JSON is smaller to send
+    pretty_json: bool = False
+
     def get_api_key(self, provider: str, domain: str | None = None) -> str | None:
         """Get API key for a provider, checking domain-specific config first.
 
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
+import orjson
 from pydantic import BaseModel
+from pydantic_core import PydanticSerializationError
 
 
 class OutputFormat(str, Enum):
@@ -20,6 +23,20 @@ class OutputFormat(str, Enum):
     HTML = "html"
 
 
+# Output format per format name / file extension
+_FORMATS_BY_NAME: dict[str, OutputFormat] = {fmt.value: fmt for fmt in OutputFormat}
+
+
+def resolve_output_format(output_file: str | Path, output_format: str | None) -> OutputFormat:
+    """Pick the output format from output_format or the file extension.
+
+    Matching is case-insensitive, so "report.MD" is written as Markdown.
+    Unrecognized formats fall back to JSON.
+    """
+    name = output_format or Path(output_file).suffix.lstrip(".")
+    return _FORMATS_BY_NAME.get(name.lower(), OutputFormat.JSON)
+
+
 class FileOutputConfig(BaseModel):
     """Configuration for file output."""
 
@@ -52,37 +69,61 @@ async def write_result_to_file(
     if config.create_dirs:
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Convert result to dict if it's a Pydantic model
-    if isinstance(result, BaseModel):
-        result_dict = result.model_dump(mode="python")
-    else:
-        result_dict = result
-
-    # Generate content based on format
-    content = _format_content(result_dict, config.format)
-
-    # Add timestamp header if requested
-    if config.add_timestamp:
-        timestamp = datetime.utcnow().isoformat()
-        if config.format == OutputFormat.MARKDOWN:
-            header = f"# Generated: {timestamp}\n\n"
-        elif config.format == OutputFormat.HTML:
-            header = f"<!-- Generated: {timestamp} -->\n\n"
-        elif config.format == OutputFormat.JSON:
-            result_dict["_generated_at"] = timestamp
-            content = _format_content(result_dict, config.format)
-            header = ""
-        else:
-            header = f"Generated: {timestamp}\n\n"
-        content = header + content
+    timestamp = datetime.utcnow().isoformat() if config.add_timestamp else None
 
-    # Write to file
-    mode = "a" if config.append else "w"
-    output_path.write_text(content, encoding="utf-8")
+    # JSON fast path: serialize models in pydantic-core without building a dict
+    content = None
+    if isinstance(result, BaseModel) and config.format == OutputFormat.JSON:
+        content = _model_to_json(result, timestamp)
+
+    if content is None:
+        # Convert result to dict if it's a Pydantic model
+        if isinstance(result, BaseModel):
+            result_dict = result.model_dump(mode="python")
+        else:
+            result_dict = result
+
+        # Add timestamp (JSON carries it as a field, so set it before serializing)
+        header = ""
+        if timestamp is not None:
+            if config.format == OutputFormat.MARKDOWN:
+                header = f"# Generated: {timestamp}\n\n"
+            elif config.format == OutputFormat.HTML:
+                header = f"<!-- Generated: {timestamp} -->\n\n"
+            elif config.format == OutputFormat.JSON:
+                result_dict = {**result_dict, "_generated_at": timestamp}
+            else:
+                header = f"Generated: {timestamp}\n\n"
+
+        # Generate content based on format
+        content = header + _format_content(result_dict, config.format)
+
+    # Write to file off the event loop
+    await asyncio.to_thread(output_path.write_text, content, encoding="utf-8")
 
     return output_path
 
 
+def _model_to_json(model: BaseModel, timestamp: str | None) -> str | None:
+    """Serialize a model to indented JSON, appending _generated_at if given.
+
+    Returns None when the model holds values pydantic cannot serialize, so
+    the caller can fall back to the generic encoder (which stringifies them).
+    """
+    try:
+        content = model.model_dump_json(indent=2)
+    except PydanticSerializationError:
+        return None
+
+    if timestamp is not None:
+        generated = f'"_generated_at": "{timestamp}"'
+        if content == "{}":
+            content = f"{{\n  {generated}\n}}"
+        else:
+            content = f"{content[:-2]},\n  {generated}\n}}"
+    return content
+
+
 def _format_content(data: dict[str, Any], format: OutputFormat) -> str:
     """Format data according to output format.
 
@@ -94,7 +135,11 @@ def _format_content(data: dict[str, Any], format: OutputFormat) -> str:
         Formatted string content
     """
     if format == OutputFormat.JSON:
-        return json.dumps(data, indent=2, default=str)
+        return orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        ).decode("utf-8")
 
     elif format == OutputFormat.MARKDOWN:
         return _to_markdown(data)
@@ -6,7 +6,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl, field_serializer
 
 
 class ResultType(str, Enum):
@@ -37,10 +37,10 @@ class SearchResult(BaseModel):
     relevance_score: float | None = None
     metadata: dict[str, Any] = Field(default_factory=dict)
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None,
-        }
+    @field_serializer("published_date", when_used="json")
+    def _serialize_published_date(self, value: datetime | None) -> str | None:
+        """Write published_date with datetime.isoformat() in JSON output."""
+        return value.isoformat() if value else None
 
 
 class SearchResponse(BaseModel):
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import importlib
+import logging
 import pkgutil
+from collections.abc import Awaitable, Callable
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -13,8 +16,11 @@ if TYPE_CHECKING:
 # Global registries
 _TOOL_REGISTRY: dict[str, dict[str, type[BaseTool]]] = {}
 _PROVIDER_REGISTRY: dict[str, dict[str, type[Any]]] = {}
+_SHUTDOWN_HOOKS: list[Callable[[], Awaitable[None]]] = []
 _discovered = False
 
+logger = logging.getLogger(__name__)
+
 
 def register_tool(domain: str):
     """Decorator to register a tool under a domain.
@@ -71,6 +77,38 @@ def register_provider(domain: str):
     return decorator
 
 
+def register_shutdown_hook(
+    hook: Callable[[], Awaitable[None]],
+) -> Callable[[], Awaitable[None]]:
+    """Register an async cleanup callable to run when the server stops.
+
+    Domains use this to close pooled HTTP clients held by cached providers.
+    Can be used as a decorator.
+
+    Args:
+        hook: Zero-argument coroutine function
+
+    Returns:
+        The hook, unchanged
+    """
+    if hook not in _SHUTDOWN_HOOKS:
+        _SHUTDOWN_HOOKS.append(hook)
+    return hook
+
+
+async def run_shutdown_hooks() -> None:
+    """Run all registered shutdown hooks concurrently, logging (not raising) failures.
+
+    Hooks are independent (one per domain), so their connection teardowns
+    overlap instead of running back to back.
+    """
+    hooks = list(_SHUTDOWN_HOOKS)
+    outcomes = await asyncio.gather(*(hook() for hook in hooks), return_exceptions=True)
+    for hook, outcome in zip(hooks, outcomes, strict=True):
+        if isinstance(outcome, Exception):
+            logger.error("Shutdown hook %r failed", hook, exc_info=outcome)
+
+
 def get_tools(domains: list[str] | None = None) -> dict[str, type[BaseTool]]:
     """Get all registered tools, optionally filtered by domains.
 
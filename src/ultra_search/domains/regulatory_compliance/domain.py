@@ -2,9 +2,21 @@
 
 from __future__ import annotations
 
+import json
+import zlib
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any, ClassVar
 
-from pydantic import BaseModel, Field
+from pydantic import (
+    BaseModel,
+    Field,
+    ModelWrapValidatorHandler,
+    PrivateAttr,
+    computed_field,
+    field_serializer,
+    model_validator,
+)
 
 from ultra_search.core.base import BaseTool
 from ultra_search.core.registry import register_tool
@@ -50,7 +62,43 @@ class FMCSAAuthorityInfo(BaseModel):
     docket_numbers: list[str] = Field(default_factory=list)
     mc_number: str | None = None
 
-    metadata: dict[str, Any] = Field(default_factory=dict)
+    # Raw API record, kept compressed until someone reads metadata; the
+    # decoded record is then kept so repeat reads decode only once
+    _raw_blob: bytes = PrivateAttr(default=b"")
+    _raw_data: dict[str, Any] | None = PrivateAttr(default=None)
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def metadata(self) -> Mapping[str, Any]:
+        """Raw FMCSA record, decompressed on first access.
+
+        The mapping is read-only; use set_raw_data to replace the record.
+        """
+        if self._raw_data is None:
+            self._raw_data = json.loads(zlib.decompress(self._raw_blob)) if self._raw_blob else {}
+        return MappingProxyType(self._raw_data)
+
+    @field_serializer("metadata")
+    def _serialize_metadata(self, metadata: Mapping[str, Any]) -> dict[str, Any]:
+        """Dump metadata as a plain dict."""
+        return dict(metadata)
+
+    @model_validator(mode="wrap")
+    @classmethod
+    def _accept_metadata(
+        cls, data: Any, handler: ModelWrapValidatorHandler[FMCSAAuthorityInfo]
+    ) -> FMCSAAuthorityInfo:
+        """Accept metadata on input, so dumped models and saved JSON round-trip."""
+        info = handler(data)
+        raw = data.get("metadata") if isinstance(data, dict) else None
+        if raw:
+            info.set_raw_data(raw)
+        return info
+
+    def set_raw_data(self, data: dict[str, Any]) -> None:
+        """Store the raw API record backing metadata."""
+        self._raw_blob = zlib.compress(json.dumps(data).encode("utf-8"), 3)
+        self._raw_data = None
 
 
 class BusinessVerificationInfo(BaseModel):
@@ -2,17 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ultra_search.core.config import Settings
 
 from ultra_search.core.base import BaseProvider
+from ultra_search.core.registry import register_shutdown_hook
+
+# Provider instances keyed by (provider_name, id(settings)) so each keeps its
+# HTTP client and FMCSA's cache database open across tool calls. Entries hold
+# the settings object too: that keeps its id from being reused by a reloaded
+# Settings, and hits are confirmed by identity.
+_PROVIDER_CACHE: dict[tuple[str, int], tuple[Settings, BaseProvider]] = {}
 
 
 def get_regulatory_provider(provider_name: str, settings: "Settings") -> BaseProvider:
     """Get a regulatory compliance provider instance.
 
+    Instances are cached per settings object and reused across calls.
+
     Args:
         provider_name: Name of provider (fmcsa, middesk)
         settings: Application settings
@@ -20,6 +30,11 @@ def get_regulatory_provider(provider_name: str, settings: "Settings") -> BasePro
     Returns:
         Initialized provider instance
     """
+    cache_key = (provider_name, id(settings))
+    cached = _PROVIDER_CACHE.get(cache_key)
+    if cached is not None and cached[0] is settings:
+        return cached[1]
+
     providers = {}
 
     # Lazy import providers
@@ -39,9 +54,20 @@ def get_regulatory_provider(provider_name: str, settings: "Settings") -> BasePro
     provider_cls = providers[provider_name]
     api_key = settings.get_api_key(provider_name, domain="regulatory_compliance")
 
-    return provider_cls(api_key=api_key)
+    provider = provider_cls(api_key=api_key)
+    _PROVIDER_CACHE[cache_key] = (settings, provider)
+    return provider
+
+
+@register_shutdown_hook
+async def close_regulatory_providers() -> None:
+    """Close and forget all cached provider instances."""
+    providers = [provider for _, provider in _PROVIDER_CACHE.values()]
+    _PROVIDER_CACHE.clear()
+    await asyncio.gather(*(provider.close() for provider in providers))
 
 
 __all__ = [
     "get_regulatory_provider",
+    "close_regulatory_providers",
 ]
@@ -13,12 +13,27 @@ The FMCSA provides free API access to motor carrier data including:
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+from pathlib import Path
+from typing import Any, ClassVar
 
 import httpx
-
-from ultra_search.core.base import BaseProvider
-from ultra_search.domains.regulatory_compliance.domain import FMCSAAuthorityInfo
+from pydantic import BaseModel
+
+from ultra_search.core.base import BaseProvider, BaseTool
+from ultra_search.core.cache import DiskCache
+from ultra_search.core.file_output import (
+    FileOutputConfig,
+    OutputFormat,
+    write_result_to_file,
+)
+from ultra_search.core.registry import register_tool
+from ultra_search.domains.regulatory_compliance.domain import (
+    FMCSAAuthorityInfo,
+    VerifyBusinessInput,
+    VerifyBusinessOutput,
+)
+from ultra_search.domains.regulatory_compliance.providers import get_regulatory_provider
 
 
 class FMCSAProvider(BaseProvider):
@@ -39,6 +54,22 @@ class FMCSAProvider(BaseProvider):
     base_url = "https://mobile.fmcsa.dot.gov/qc/services/carriers"
     requires_auth = True
 
+    # FMCSA data refreshes nightly, so cached lookups stay valid for a day
+    cache_ttl: ClassVar[float] = 86400.0
+
+    def __init__(self, api_key: str | None = None, **kwargs: Any) -> None:
+        """Initialize provider.
+
+        Args:
+            api_key: FMCSA web key
+            **kwargs: cache_path overrides the on-disk cache location
+        """
+        super().__init__(api_key, **kwargs)
+        cache_path = kwargs.get("cache_path") or (
+            Path.home() / ".ultra_search" / "cache" / "fmcsa.db"
+        )
+        self._cache = DiskCache(cache_path, default_ttl=self.cache_ttl)
+
     async def get_client(self) -> httpx.AsyncClient:
         """Get HTTP client with API key authentication."""
         if self._client is None:
@@ -65,11 +96,33 @@ class FMCSAProvider(BaseProvider):
         endpoint: str,
         **kwargs: Any,
     ) -> dict[str, Any]:
-        """Make authenticated request to FMCSA API."""
+        """Make authenticated request to FMCSA API.
+
+        GET responses are cached on disk so repeat lookups skip the network,
+        including across process restarts. SQLite calls block, so they run in
+        a worker thread.
+        """
+        cache_key = None
+        if method == "GET":
+            params = sorted((kwargs.get("params") or {}).items())
+            cache_key = f"{endpoint}?{params}"
+            cached = await asyncio.to_thread(self._cache.get, cache_key)
+            if cached is not None:
+                return cached
+
         client = await self.get_client()
         response = await client.request(method, endpoint, **kwargs)
         response.raise_for_status()
-        return response.json()
+        data = response.json()
+
+        if cache_key is not None:
+            await asyncio.to_thread(self._cache.set, cache_key, data)
+        return data
+
+    async def close(self) -> None:
+        """Close the HTTP client and cache database."""
+        await super().close()
+        await asyncio.to_thread(self._cache.close)
 
     async def lookup_by_dot(self, dot_number: str) -> FMCSAAuthorityInfo | None:
         """Lookup carrier by DOT number.
@@ -122,12 +175,11 @@ class FMCSAProvider(BaseProvider):
                 params={"name": legal_name}
             )
 
+            if not data:
+                return None
+
             # API may return array of matches, take first
-            if isinstance(data, list) and len(data) > 0:
-                return self._parse_carrier_data(data[0])
-            elif isinstance(data, dict):
-                return self._parse_carrier_data(data)
-            return None
+            return self._parse_carrier_data(data[0] if type(data) is list else data)
 
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
@@ -140,7 +192,7 @@ class FMCSAProvider(BaseProvider):
         Note: Field names based on FMCSA API schema. Adjust as needed when
         testing with real API responses.
         """
-        return FMCSAAuthorityInfo(
+        info = FMCSAAuthorityInfo(
             dot_number=str(data.get("dotNumber", data.get("usdotNumber", ""))),
             legal_name=data.get("legalName", ""),
             dba_name=data.get("dbaName"),
@@ -165,8 +217,9 @@ class FMCSAProvider(BaseProvider):
             carrier_type=data.get("entityType"),
             docket_numbers=data.get("docketNumbers", []),
             mc_number=data.get("mcNumber"),
-            metadata=data,
         )
+        info.set_raw_data(data)
+        return info
 
     def _format_address(
         self,
@@ -207,14 +260,6 @@ class VerifyBusinessKYB(BaseTool[VerifyBusinessInput, VerifyBusinessOutput]):
 
     async def execute(self, input_data: VerifyBusinessInput) -> VerifyBusinessOutput:
         """Execute business verification."""
-        from pathlib import Path
-        from ultra_search.core.file_output import (
-            FileOutputConfig,
-            OutputFormat,
-            write_result_to_file,
-        )
-        from ultra_search.domains.regulatory_compliance.providers import get_regulatory_provider
-
         # Get Middesk provider
         provider = get_regulatory_provider("middesk", self.settings)
 
@@ -2,13 +2,54 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import re
+from collections import Counter
 from datetime import datetime
 from typing import Any, ClassVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from ultra_search.core.base import BaseTool
+from ultra_search.core.file_output import (
+    FileOutputConfig,
+    resolve_output_format,
+    write_result_to_file,
+)
 from ultra_search.core.registry import register_tool
+from ultra_search.domains.reviews.providers import get_reviews_provider
+
+# Rating-distribution thresholds (percent of reviews) used by fraud detection
+SUSPICIOUS_FIVE_STAR_PCT = 70
+POLARIZED_PCT = 40
+
+# Complaint phrases typical of moving-company fraud reviews
+COMPLAINT_PHRASES = (
+    "hostage",
+    "held my belongings",
+    "held our belongings",
+    "price increased",
+    "raised the price",
+    "hidden fees",
+    "extra charges",
+    "damaged",
+    "never delivered",
+    "never showed up",
+    "scam",
+)
+
+# One compiled alternation scans each review once for every phrase; it runs
+# against Review.search_text, which is already lowercased
+_COMPLAINT_RE = re.compile(
+    r"\b(?:" + "|".join(re.escape(p) for p in COMPLAINT_PHRASES) + r")\b"
+)
+
+# Reviews shorter than this (in words) are too generic to flag as copies
+MIN_DUPLICATE_WORDS = 8
+
+# Runs of anything but letters and digits, in any script
+_NON_WORD_RE = re.compile(r"[\W_]+", re.UNICODE)
 
 
 # === DATA MODELS ===
@@ -30,6 +71,18 @@ class Review(BaseModel):
 
     metadata: dict[str, Any] = Field(default_factory=dict)
 
+    # Lowercased text, normalized once for pattern scans
+    _search_text: str = PrivateAttr(default="")
+
+    def model_post_init(self, __context: Any) -> None:
+        """Normalize review text once at construction."""
+        self._search_text = (self.text or "").lower()
+
+    @property
+    def search_text(self) -> str:
+        """Lowercased review text for case-insensitive matching."""
+        return self._search_text
+
 
 class BusinessReviewsSummary(BaseModel):
     """Aggregated review data for a business."""
@@ -54,6 +107,62 @@ class BusinessReviewsSummary(BaseModel):
     metadata: dict[str, Any] = Field(default_factory=dict)
 
 
+def detect_complaint_phrases(reviews: list[Review]) -> list[str]:
+    """Flag known complaint phrases found in review text.
+
+    Args:
+        reviews: Parsed reviews to scan
+
+    Returns:
+        One pattern string per phrase, with the number of reviews mentioning it
+    """
+    counts: Counter[str] = Counter()
+    for review in reviews:
+        if review.search_text:
+            counts.update(set(_COMPLAINT_RE.findall(review.search_text)))
+
+    return [
+        f"Complaint phrase '{phrase}' in {count} review(s)"
+        for phrase, count in counts.most_common()
+    ]
+
+
+def detect_duplicate_reviews(reviews: list[Review]) -> list[str]:
+    """Flag review text posted more than once, within or across platforms.
+
+    Text is fingerprinted after dropping case, punctuation and whitespace,
+    so copies are found in a single pass rather than by pairwise comparison.
+
+    Args:
+        reviews: Reviews from one or more platforms
+
+    Returns:
+        One pattern string per duplicated text
+    """
+    seen: dict[bytes, list[str]] = {}
+    for review in reviews:
+        words = _NON_WORD_RE.sub(" ", review.search_text.casefold()).split()
+        if len(words) < MIN_DUPLICATE_WORDS:
+            continue
+        digest = hashlib.blake2b(" ".join(words).encode(), digest_size=16).digest()
+        seen.setdefault(digest, []).append(review.platform)
+
+    patterns = []
+    for platforms in seen.values():
+        if len(platforms) < 2:
+            continue
+        distinct = sorted(set(platforms))
+        if len(distinct) > 1:
+            patterns.append(
+                f"Same review text posted on {', '.join(distinct)} (possible copy-paste reviews)"
+            )
+        else:
+            patterns.append(
+                f"{distinct[0]}: Same review text posted {len(platforms)} times"
+            )
+    return patterns
+
+
 # === INPUT/OUTPUT MODELS ===
 
 
@@ -108,6 +217,11 @@ class AggregateReviewsInput(BaseModel):
         default=["google", "yelp"],
         description="Platforms to search: google, yelp"
     )
+    timeout: float = Field(
+        default=10.0,
+        gt=0,
+        description="Seconds to wait for platforms; slower ones are left out of the result"
+    )
 
     output_file: str | None = Field(None, description="Optional file path")
     output_format: str | None = Field(None, description="json|md|txt|html")
@@ -157,14 +271,6 @@ class SearchGoogleReviews(BaseTool[SearchGoogleReviewsInput, SearchGoogleReviews
 
     async def execute(self, input_data: SearchGoogleReviewsInput) -> SearchGoogleReviewsOutput:
         """Execute Google reviews search."""
-        from pathlib import Path
-        from ultra_search.core.file_output import (
-            FileOutputConfig,
-            OutputFormat,
-            write_result_to_file,
-        )
-        from ultra_search.domains.reviews.providers import get_reviews_provider
-
         provider = get_reviews_provider("google_places", self.settings)
 
         reviews_summary = await provider.get_reviews(
@@ -182,8 +288,7 @@ class SearchGoogleReviews(BaseTool[SearchGoogleReviewsInput, SearchGoogleReviews
 
         # File output
         if input_data.output_file:
-            format_str = input_data.output_format or Path(input_data.output_file).suffix.lstrip(".")
-            output_format = OutputFormat(format_str) if format_str in ["json", "md", "txt", "html"] else OutputFormat.JSON
+            output_format = resolve_output_format(input_data.output_file, input_data.output_format)
 
             config = FileOutputConfig(path=input_data.output_file, format=output_format)
             written_path = await write_result_to_file(output, config)
@@ -211,14 +316,6 @@ class SearchYelpReviews(BaseTool[SearchYelpReviewsInput, SearchYelpReviewsOutput
 
     async def execute(self, input_data: SearchYelpReviewsInput) -> SearchYelpReviewsOutput:
         """Execute Yelp reviews search."""
-        from pathlib import Path
-        from ultra_search.core.file_output import (
-            FileOutputConfig,
-            OutputFormat,
-            write_result_to_file,
-        )
-        from ultra_search.domains.reviews.providers import get_reviews_provider
-
         provider = get_reviews_provider("yelp", self.settings)
 
         reviews_summary = await provider.get_reviews(
@@ -236,8 +333,7 @@ class SearchYelpReviews(BaseTool[SearchYelpReviewsInput, SearchYelpReviewsOutput
 
         # File output
         if input_data.output_file:
-            format_str = input_data.output_format or Path(input_data.output_file).suffix.lstrip(".")
-            output_format = OutputFormat(format_str) if format_str in ["json", "md", "txt", "html"] else OutputFormat.JSON
+            output_format = resolve_output_format(input_data.output_file, input_data.output_format)
 
             config = FileOutputConfig(path=input_data.output_file, format=output_format)
             written_path = await write_result_to_file(output, config)
@@ -270,58 +366,58 @@ class AggregateReviews(BaseTool[AggregateReviewsInput, AggregateReviewsOutput]):
 
     async def execute(self, input_data: AggregateReviewsInput) -> AggregateReviewsOutput:
         """Execute multi-platform review aggregation."""
-        import asyncio
-        from pathlib import Path
-        from ultra_search.core.file_output import (
-            FileOutputConfig,
-            OutputFormat,
-            write_result_to_file,
-        )
-        from ultra_search.domains.reviews.providers import get_reviews_provider
-
         # Fetch from all platforms in parallel
-        tasks = []
-        providers = []
+        tasks: list[asyncio.Task[BusinessReviewsSummary]] = []
 
         for platform in input_data.platforms:
             try:
                 provider = get_reviews_provider(platform, self.settings)
-                providers.append((platform, provider))
-
-                if platform == "google":
-                    task = provider.get_reviews(
-                        business_name=input_data.business_name,
-                        address=input_data.address,
-                        phone=input_data.phone,
-                    )
-                elif platform == "yelp":
-                    task = provider.get_reviews(
-                        business_name=input_data.business_name,
-                        location=input_data.location,
-                        phone=input_data.phone,
-                    )
-                else:
-                    continue
-
-                tasks.append(task)
             except Exception:
                 # Skip unavailable providers
                 continue
 
-        # Execute in parallel
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+            if platform == "google":
+                coro = provider.get_reviews(
+                    business_name=input_data.business_name,
+                    address=input_data.address,
+                    phone=input_data.phone,
+                )
+            elif platform == "yelp":
+                coro = provider.get_reviews(
+                    business_name=input_data.business_name,
+                    location=input_data.location,
+                    phone=input_data.phone,
+                )
+            else:
+                continue
+
+            tasks.append(asyncio.create_task(coro, name=platform))
+
+        # Wait for every platform up to the deadline; platforms still pending
+        # then are cancelled and the rest are returned as a partial result
+        done = set()
+        if tasks:
+            try:
+                done, _ = await asyncio.wait(tasks, timeout=input_data.timeout)
+            finally:
+                for task in tasks:
+                    task.cancel()
 
-        # Aggregate results
         platform_summaries = []
+        suspicious_patterns = []
         total_reviews = 0
         all_ratings = []
 
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                continue  # Skip failed providers
+        # Tasks are in requested platform order, so the output is too
+        for task in tasks:
+            # Skip platforms that timed out or whose provider failed
+            if task not in done or task.exception() is not None:
+                continue
 
+            result = task.result()
             platform_summaries.append(result)
             total_reviews += result.total_reviews
+            suspicious_patterns.extend(self._detect_fraud_patterns([result]))
 
             if result.average_rating:
                 all_ratings.append(result.average_rating)
@@ -329,8 +425,12 @@ class AggregateReviews(BaseTool[AggregateReviewsInput, AggregateReviewsOutput]):
         # Calculate overall average
         overall_avg = sum(all_ratings) / len(all_ratings) if all_ratings else None
 
-        # Detect fraud patterns
-        suspicious_patterns = self._detect_fraud_patterns(platform_summaries)
+        suspicious_patterns.extend(
+            detect_duplicate_reviews(
+                [review for summary in platform_summaries for review in summary.reviews]
+            )
+        )
+        suspicious_patterns = list(dict.fromkeys(suspicious_patterns))
         fraud_risk = len(suspicious_patterns) * 15.0  # Simple scoring
 
         output = AggregateReviewsOutput(
@@ -345,8 +445,7 @@ class AggregateReviews(BaseTool[AggregateReviewsInput, AggregateReviewsOutput]):
 
         # File output
         if input_data.output_file:
-            format_str = input_data.output_format or Path(input_data.output_file).suffix.lstrip(".")
-            output_format = OutputFormat(format_str) if format_str in ["json", "md", "txt", "html"] else OutputFormat.JSON
+            output_format = resolve_output_format(input_data.output_file, input_data.output_format)
 
             config = FileOutputConfig(path=input_data.output_file, format=output_format)
             written_path = await write_result_to_file(output, config)
@@ -371,25 +470,26 @@ class AggregateReviews(BaseTool[AggregateReviewsInput, AggregateReviewsOutput]):
             patterns.extend(summary.suspicious_patterns)
 
             # Check rating distribution
-            if summary.rating_distribution:
-                five_star = summary.rating_distribution.get("5", 0)
-                one_star = summary.rating_distribution.get("1", 0)
-                total = sum(summary.rating_distribution.values())
-
-                if total > 0:
-                    five_star_pct = (five_star / total) * 100
-                    one_star_pct = (one_star / total) * 100
-
-                    # Suspicious if >70% are 5-star
-                    if five_star_pct > 70:
-                        patterns.append(
-                            f"{summary.platform}: {five_star_pct:.0f}% 5-star reviews (possible fake positives)"
-                        )
-
-                    # Polarized reviews (lots of 5-star and 1-star, few middle)
-                    if five_star_pct > 40 and one_star_pct > 40:
-                        patterns.append(
-                            f"{summary.platform}: Polarized reviews (possible review manipulation)"
-                        )
-
-        return list(set(patterns))  # Deduplicate
+            distribution = summary.rating_distribution
+            total = sum(distribution.values())
+            if total == 0:
+                continue
+
+            five_star_pct = distribution.get("5", 0) * 100 / total
+            if five_star_pct <= POLARIZED_PCT:
+                continue  # Neither check below can fire
+
+            # Suspicious if >70% are 5-star
+            if five_star_pct > SUSPICIOUS_FIVE_STAR_PCT:
+                patterns.append(
+                    f"{summary.platform}: {five_star_pct:.0f}% 5-star reviews "
+                    "(possible fake positives)"
+                )
+
+            # Polarized reviews (lots of 5-star and 1-star, few middle)
+            if distribution.get("1", 0) * 100 / total > POLARIZED_PCT:
+                patterns.append(
+                    f"{summary.platform}: Polarized reviews (possible review manipulation)"
+                )
+
+        return list(dict.fromkeys(patterns))  # Deduplicate, keeping first-seen order
@@ -2,17 +2,51 @@
 
 from __future__ import annotations
 
+import asyncio
+from functools import cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ultra_search.core.config import Settings
 
 from ultra_search.core.base import BaseProvider
+from ultra_search.core.registry import register_shutdown_hook
+
+# Alternate names accepted by get_reviews_provider
+_PROVIDER_ALIASES = {"google": "google_places"}
+
+# Provider instances keyed by (provider_name, id(settings)) so each keeps its
+# HTTP client and connection pool across tool calls. Entries hold the settings
+# object too: that keeps its id from being reused by a reloaded Settings, and
+# hits are confirmed by identity.
+_PROVIDER_CACHE: dict[tuple[str, int], tuple[Settings, BaseProvider]] = {}
+
+
+@cache
+def _get_provider_class(provider_name: str) -> type[BaseProvider]:
+    """Resolve a provider class, importing its module on first use.
+
+    Provider modules import the reviews domain models, and the domain module
+    imports this package, so provider modules must not be imported eagerly.
+    """
+    if provider_name == "google_places":
+        from ultra_search.domains.reviews.providers.google_places import GooglePlacesProvider
+        return GooglePlacesProvider
+    if provider_name == "yelp":
+        from ultra_search.domains.reviews.providers.yelp import YelpProvider
+        return YelpProvider
+
+    raise ValueError(
+        f"Unknown reviews provider: {provider_name}. "
+        f"Available: google_places, yelp"
+    )
 
 
 def get_reviews_provider(provider_name: str, settings: "Settings") -> BaseProvider:
     """Get a reviews provider instance.
 
+    Instances are cached per settings object and reused across calls.
+
     Args:
         provider_name: Name of provider (google_places, yelp)
         settings: Application settings
@@ -20,31 +54,27 @@ def get_reviews_provider(provider_name: str, settings: "Settings") -> BaseProvid
     Returns:
         Initialized provider instance
     """
-    providers = {}
+    provider_name = _PROVIDER_ALIASES.get(provider_name, provider_name)
 
-    if provider_name == "google_places" or provider_name == "google":
-        from ultra_search.domains.reviews.providers.google_places import GooglePlacesProvider
-        providers["google_places"] = GooglePlacesProvider
-        providers["google"] = GooglePlacesProvider
-    elif provider_name == "yelp":
-        from ultra_search.domains.reviews.providers.yelp import YelpProvider
-        providers["yelp"] = YelpProvider
+    cache_key = (provider_name, id(settings))
+    cached = _PROVIDER_CACHE.get(cache_key)
+    if cached is not None and cached[0] is settings:
+        return cached[1]
 
-    if provider_name not in providers:
-        raise ValueError(
-            f"Unknown reviews provider: {provider_name}. "
-            f"Available: google_places, yelp"
-        )
+    provider_cls = _get_provider_class(provider_name)
+    api_key = settings.get_api_key(provider_name, domain="reviews")
 
-    provider_cls = providers[provider_name]
+    provider = provider_cls(api_key=api_key)
+    _PROVIDER_CACHE[cache_key] = (settings, provider)
+    return provider
 
-    # Handle both google_places and google_places_api_key
-    if provider_name in ["google_places", "google"]:
-        api_key = settings.get_api_key("google_places", domain="reviews")
-    else:
-        api_key = settings.get_api_key(provider_name, domain="reviews")
 
-    return provider_cls(api_key=api_key)
+@register_shutdown_hook
+async def close_reviews_providers() -> None:
+    """Close and forget all cached provider instances."""
+    providers = [provider for _, provider in _PROVIDER_CACHE.values()]
+    _PROVIDER_CACHE.clear()
+    await asyncio.gather(*(provider.close() for provider in providers))
 
 
-__all__ = ["get_reviews_provider"]
+__all__ = ["get_reviews_provider", "close_reviews_providers"]
@@ -12,13 +12,40 @@ Setup:
 
 from __future__ import annotations
 
+from collections import Counter
 from datetime import datetime
 from typing import Any
 
 import httpx
+import orjson
 
 from ultra_search.core.base import BaseProvider
-from ultra_search.domains.reviews.domain import BusinessReviewsSummary, Review
+from ultra_search.domains.reviews.domain import (
+    BusinessReviewsSummary,
+    Review,
+    detect_complaint_phrases,
+)
+
+# Response cache lifetimes (seconds); business profiles and reviews change slowly
+FIND_PLACE_TTL = 300.0
+PLACE_DETAILS_TTL = 300.0
+
+# Field masks, pre-joined since they are identical on every request.
+# "full" is exactly what _parse_reviews reads.
+FIND_PLACE_FIELDS = "place_id,name"
+FIELDS_CSV = (
+    "place_id,name,formatted_address,formatted_phone_number,"
+    "rating,user_ratings_total,reviews,website"
+)
+MINIMAL_FIELDS_CSV = "place_id,rating,reviews"
+
+PLACE_DETAIL_FIELDS = {"full": FIELDS_CSV, "minimal": MINIMAL_FIELDS_CSV}
+
+# Find Place candidates tried, best first, when phone/address can disambiguate
+MAX_PLACE_CANDIDATES = 2
+
+# Four or more reviews inside this span is flagged as time clustering
+CLUSTER_WINDOW_SECONDS = 7 * 24 * 60 * 60
 
 
 class GooglePlacesProvider(BaseProvider):
@@ -44,7 +71,13 @@ class GooglePlacesProvider(BaseProvider):
 
             self._client = httpx.AsyncClient(
                 base_url=self.base_url,
-                timeout=httpx.Timeout(30.0),
+                http2=True,
+                timeout=httpx.Timeout(30.0, connect=5.0),
+                limits=httpx.Limits(
+                    max_connections=20,
+                    max_keepalive_connections=10,
+                    keepalive_expiry=60.0,
+                ),
             )
         return self._client
 
@@ -64,7 +97,7 @@ class GooglePlacesProvider(BaseProvider):
 
         response = await client.request(method, endpoint, **kwargs)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     async def get_reviews(
         self,
@@ -72,6 +105,7 @@ class GooglePlacesProvider(BaseProvider):
         address: str | None = None,
         phone: str | None = None,
         max_reviews: int = 20,
+        detail_level: str = "full",
     ) -> BusinessReviewsSummary:
         """Get Google reviews for a business.
 
@@ -80,14 +114,16 @@ class GooglePlacesProvider(BaseProvider):
             address: Optional address for matching
             phone: Optional phone for matching
             max_reviews: Max reviews to retrieve
+            detail_level: "full", or "minimal" to fetch only rating and reviews
+                (skips the billed Contact-tier fields)
 
         Returns:
             Business reviews summary
         """
-        # Step 1: Find the business (Place ID)
-        place_id = await self._find_place(business_name, address)
+        # Step 1: Find the business (candidate Place IDs)
+        place_ids = await self._find_place(business_name, address)
 
-        if not place_id:
+        if not place_ids:
             # Return empty summary if not found
             return BusinessReviewsSummary(
                 business_name=business_name,
@@ -96,17 +132,62 @@ class GooglePlacesProvider(BaseProvider):
                 metadata={"error": "Business not found"},
             )
 
-        # Step 2: Get Place Details with reviews
-        details = await self._get_place_details(place_id, max_reviews)
-
+        # Step 2: Get Place Details with reviews. Each details call is billed,
+        # so runners-up are fetched only while the best candidate so far does
+        # not match every phone/address detail given.
+        if detail_level == "minimal" or not (address or phone):
+            place_ids = place_ids[:1]
+        full_score = (2 if phone else 0) + (1 if address else 0)
+
+        best: tuple[int, dict[str, Any]] | None = None
+        first_error: Exception | None = None
+        for place_id in place_ids:
+            try:
+                candidate = await self._get_place_details(place_id, max_reviews, detail_level)
+            except Exception as e:
+                first_error = first_error or e
+                continue
+
+            score = self._match_score(candidate, address, phone)
+            if best is None or score > best[0]:
+                best = (score, candidate)
+            if best[0] == full_score:
+                break
+
+        if best is None:
+            raise first_error
+
+        details = best[1]
         return self._parse_reviews(details, business_name)
 
+    @staticmethod
+    def _match_score(
+        details: dict[str, Any],
+        address: str | None,
+        phone: str | None,
+    ) -> int:
+        """Score how well place details match the caller's phone/address."""
+        score = 0
+
+        if phone:
+            wanted = "".join(c for c in phone if c.isdigit())[-10:]
+            found = "".join(c for c in details.get("formatted_phone_number", "") if c.isdigit())
+            if wanted and found.endswith(wanted):
+                score += 2
+
+        if address:
+            street = address.split(",")[0].strip().lower()
+            if street and street in details.get("formatted_address", "").lower():
+                score += 1
+
+        return score
+
     async def _find_place(
         self,
         business_name: str,
         address: str | None = None,
-    ) -> str | None:
-        """Find place_id for a business.
+    ) -> list[str]:
+        """Find candidate place_ids for a business, best first.
 
         Uses Find Place API to search by name and optional address.
         """
@@ -114,44 +195,47 @@ class GooglePlacesProvider(BaseProvider):
         if address:
             query += f", {address}"
 
-        data = await self._make_request(
-            "GET",
-            "/findplacefromtext/json",
-            params={
-                "input": query,
-                "inputtype": "textquery",
-                "fields": "place_id,name",
-            },
+        data = await self._cached_request(
+            f"places:find:{query}",
+            FIND_PLACE_TTL,
+            lambda: self._make_request(
+                "GET",
+                "/findplacefromtext/json",
+                params={
+                    "input": query,
+                    "inputtype": "textquery",
+                    "fields": FIND_PLACE_FIELDS,
+                },
+            ),
         )
 
-        candidates = data.get("candidates", [])
-        if candidates:
-            return candidates[0].get("place_id")
-
-        return None
+        candidates = data.get("candidates", [])[:MAX_PLACE_CANDIDATES]
+        return [c["place_id"] for c in candidates if c.get("place_id")]
 
-    async def _get_place_details(self, place_id: str, max_reviews: int) -> dict:
+    async def _get_place_details(
+        self,
+        place_id: str,
+        max_reviews: int,
+        detail_level: str = "full",
+    ) -> dict:
         """Get detailed place information including reviews.
 
-        Uses Place Details API with fields mask for reviews.
+        Uses Place Details API with a fields mask limited to what
+        _parse_reviews reads, since Google bills per field tier.
         """
-        fields = [
-            "name",
-            "formatted_address",
-            "formatted_phone_number",
-            "rating",
-            "user_ratings_total",
-            "reviews",
-            "website",
-        ]
-
-        data = await self._make_request(
-            "GET",
-            "/details/json",
-            params={
-                "place_id": place_id,
-                "fields": ",".join(fields),
-            },
+        fields = PLACE_DETAIL_FIELDS.get(detail_level, FIELDS_CSV)
+
+        data = await self._cached_request(
+            f"places:details:{place_id}:{detail_level}",
+            PLACE_DETAILS_TTL,
+            lambda: self._make_request(
+                "GET",
+                "/details/json",
+                params={
+                    "place_id": place_id,
+                    "fields": fields,
+                },
+            ),
         )
 
         return data.get("result", {})
@@ -164,12 +248,15 @@ class GooglePlacesProvider(BaseProvider):
         """Parse Google Places API response into reviews summary."""
         reviews_list: list[Review] = []
         reviews_data = place_data.get("reviews", [])
+        times: list[float] = []  # Unix epochs, kept for time-clustering checks
 
         for review_data in reviews_data:
             # Parse timestamp
             timestamp = None
             if "time" in review_data:
-                timestamp = datetime.fromtimestamp(review_data["time"])
+                epoch = float(review_data["time"])
+                times.append(epoch)
+                timestamp = datetime.fromtimestamp(epoch)
 
             reviews_list.append(
                 Review(
@@ -188,25 +275,21 @@ class GooglePlacesProvider(BaseProvider):
             )
 
         # Calculate rating distribution
-        distribution = {}
-        for review in reviews_list:
-            rating_str = str(int(review.rating))
-            distribution[rating_str] = distribution.get(rating_str, 0) + 1
+        distribution = Counter(str(int(r.rating)) for r in reviews_list)
 
         # Detect suspicious patterns
         suspicious = []
         if len(reviews_list) > 10:
             # Check for time clustering (many reviews in short time)
-            timestamps = [r.timestamp for r in reviews_list if r.timestamp]
-            if len(timestamps) > 5:
-                timestamps.sort()
-                # Check if > 30% of reviews are within 7 days
-                from datetime import timedelta
-                for i in range(len(timestamps) - 3):
-                    window = timestamps[i:i+4]
-                    if window[-1] - window[0] < timedelta(days=7):
-                        suspicious.append("Time clustering detected (4+ reviews within 7 days)")
-                        break
+            timestamps = sorted(times)
+            # Span of every 4-review window: ts[i + 3] - ts[i]
+            if len(timestamps) > 5 and any(
+                last - first < CLUSTER_WINDOW_SECONDS
+                for first, last in zip(timestamps, timestamps[3:], strict=False)
+            ):
+                suspicious.append("Time clustering detected (4+ reviews within 7 days)")
+
+        suspicious.extend(detect_complaint_phrases(reviews_list))
 
         return BusinessReviewsSummary(
             business_name=place_data.get("name", business_name),
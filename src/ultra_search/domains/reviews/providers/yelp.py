@@ -11,13 +11,24 @@ Setup:
 
 from __future__ import annotations
 
+from collections import Counter
 from datetime import datetime
 from typing import Any
 
 import httpx
+import orjson
 
 from ultra_search.core.base import BaseProvider
-from ultra_search.domains.reviews.domain import BusinessReviewsSummary, Review
+from ultra_search.domains.reviews.domain import (
+    BusinessReviewsSummary,
+    Review,
+    detect_complaint_phrases,
+)
+
+# Response cache lifetimes (seconds)
+BUSINESS_SEARCH_TTL = 300.0
+BUSINESS_DETAILS_TTL = 300.0
+BUSINESS_REVIEWS_TTL = 120.0
 
 
 class YelpProvider(BaseProvider):
@@ -47,7 +58,13 @@ class YelpProvider(BaseProvider):
                     "Authorization": f"Bearer {self.api_key}",
                     "Accept": "application/json",
                 },
-                timeout=httpx.Timeout(30.0),
+                http2=True,
+                timeout=httpx.Timeout(30.0, connect=5.0),
+                limits=httpx.Limits(
+                    max_connections=20,
+                    max_keepalive_connections=10,
+                    keepalive_expiry=60.0,
+                ),
             )
         return self._client
 
@@ -61,7 +78,7 @@ class YelpProvider(BaseProvider):
         client = await self.get_client()
         response = await client.request(method, endpoint, **kwargs)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     async def get_reviews(
         self,
@@ -110,7 +127,8 @@ class YelpProvider(BaseProvider):
 
         Uses Business Search endpoint.
         """
-        params = {"term": name, "limit": 5}
+        # A phone number identifies the business, so one candidate is enough
+        params = {"term": name, "limit": 1 if phone else 5}
 
         if location:
             params["location"] = location
@@ -118,7 +136,11 @@ class YelpProvider(BaseProvider):
         if phone:
             params["phone"] = phone
 
-        data = await self._make_request("GET", "/businesses/search", params=params)
+        data = await self._cached_request(
+            f"yelp:search:{name}|{location}|{phone}",
+            BUSINESS_SEARCH_TTL,
+            lambda: self._make_request("GET", "/businesses/search", params=params),
+        )
 
         businesses = data.get("businesses", [])
         if businesses:
@@ -129,7 +151,11 @@ class YelpProvider(BaseProvider):
 
     async def _get_business_details(self, business_id: str) -> dict:
         """Get business details including overall ratings."""
-        return await self._make_request("GET", f"/businesses/{business_id}")
+        return await self._cached_request(
+            f"yelp:business:{business_id}",
+            BUSINESS_DETAILS_TTL,
+            lambda: self._make_request("GET", f"/businesses/{business_id}"),
+        )
 
     async def _get_business_reviews(self, business_id: str) -> dict:
         """Get business reviews.
@@ -138,7 +164,11 @@ class YelpProvider(BaseProvider):
         For full review access, would need web scraping (against ToS) or
         Yelp partnership.
         """
-        return await self._make_request("GET", f"/businesses/{business_id}/reviews")
+        return await self._cached_request(
+            f"yelp:reviews:{business_id}",
+            BUSINESS_REVIEWS_TTL,
+            lambda: self._make_request("GET", f"/businesses/{business_id}/reviews"),
+        )
 
     def _parse_reviews(
         self,
@@ -176,10 +206,7 @@ class YelpProvider(BaseProvider):
             )
 
         # Calculate distribution
-        distribution = {}
-        for review in reviews_list:
-            rating_str = str(int(review.rating))
-            distribution[rating_str] = distribution.get(rating_str, 0) + 1
+        distribution = Counter(str(int(r.rating)) for r in reviews_list)
 
         # Format address
         location = business.get("location", {})
@@ -198,7 +225,7 @@ class YelpProvider(BaseProvider):
             total_reviews=business.get("review_count", len(reviews_list)),
             reviews=reviews_list,
             rating_distribution=distribution,
-            suspicious_patterns=[],  # Could add pattern detection here
+            suspicious_patterns=detect_complaint_phrases(reviews_list),
             address=formatted_address or None,
             phone=business.get("display_phone"),
             website=business.get("url"),
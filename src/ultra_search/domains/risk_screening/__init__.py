@@ -7,6 +7,7 @@ Providers:
 
 Tools:
 - screen_sanctions: Check entity against sanctions/watchlists
+- screen_sanctions_batch: Screen a list of entities concurrently
 - search_adverse_media: Search for negative news/complaints
 - monitor_entity_risk: Combined screening + adverse media
 """
@@ -2,14 +2,42 @@
 
 from __future__ import annotations
 
+import asyncio
+import string
+import unicodedata
+from bisect import bisect_right
 from typing import Any, ClassVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from ultra_search.core.base import BaseTool
+from ultra_search.core.file_output import (
+    FileOutputConfig,
+    resolve_output_format,
+    write_result_to_file,
+)
 from ultra_search.core.models import SearchResult
 from ultra_search.core.registry import register_tool
 
+# Overall risk-score cutoffs (inclusive) for any score above zero
+OVERALL_RISK_THRESHOLDS = (25.0, 50.0, 75.0)
+OVERALL_RISK_LABELS = ("low", "medium", "high", "critical")
+
+_PUNCTUATION_TABLE = str.maketrans("", "", string.punctuation)
+
+
+def normalize_entity_name(name: str) -> str:
+    """Normalize an entity name for fuzzy name comparison.
+
+    Folds accents ("Müller" -> "muller") by dropping combining marks after
+    NFKD decomposition, so non-Latin scripts survive intact. Also strips ASCII
+    punctuation, casefolds and collapses whitespace. The result is only used
+    to score similarity; it is never sent upstream or used as a cache key.
+    """
+    decomposed = unicodedata.normalize("NFKD", name)
+    folded = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(folded.translate(_PUNCTUATION_TABLE).casefold().split())
+
 
 # === DATA MODELS ===
 
@@ -17,6 +45,8 @@ from ultra_search.core.registry import register_tool
 class SanctionsMatch(BaseModel):
     """A single sanctions/watchlist match."""
 
+    model_config = ConfigDict(extra="ignore")
+
     entity_name: str
     match_score: float  # 0-1 confidence
     dataset: str  # Which watchlist (OFAC, UN, EU, etc.)
@@ -49,7 +79,8 @@ class AdverseMediaResult(BaseModel):
     total_articles: int
     articles: list[SearchResult] = Field(default_factory=list)
 
-    # Classification
+    # Classification: number of articles mentioning each category (an article
+    # repeating a keyword still counts once, keeping the score weights per article)
     fraud_mentions: int = 0
     scam_mentions: int = 0
     lawsuit_mentions: int = 0
@@ -93,6 +124,42 @@ class ScreenSanctionsOutput(BaseModel):
     output_file_path: str | None = None
 
 
+class ScreenSanctionsBatchInput(BaseModel):
+    """Input for batch sanctions screening."""
+
+    entity_names: list[str] = Field(
+        ..., min_length=1, max_length=500, description="Business or person names to screen"
+    )
+    entity_type: str = Field(
+        default="organization",
+        description="Type: organization, person, vessel"
+    )
+    countries: list[str] = Field(
+        default_factory=list,
+        description="Optional country filters (e.g., ['US', 'RU'])"
+    )
+    fuzzy_matching: bool = Field(
+        default=True,
+        description="Enable fuzzy name matching"
+    )
+    concurrency: int = Field(
+        default=5, ge=1, le=20, description="Maximum simultaneous screening requests"
+    )
+
+    output_file: str | None = Field(None, description="Optional file path")
+    output_format: str | None = Field(None, description="json|md|txt|html")
+
+
+class ScreenSanctionsBatchOutput(BaseModel):
+    """Output from batch sanctions screening."""
+
+    results: list[SanctionsScreeningResult] = Field(default_factory=list)
+    total_screened: int
+    entities_with_matches: int = 0
+    failed_entities: list[str] = Field(default_factory=list)
+    output_file_path: str | None = None
+
+
 class SearchAdverseMediaInput(BaseModel):
     """Input for adverse media search."""
 
@@ -184,12 +251,6 @@ class ScreenSanctions(BaseTool[ScreenSanctionsInput, ScreenSanctionsOutput]):
 
     async def execute(self, input_data: ScreenSanctionsInput) -> ScreenSanctionsOutput:
         """Execute sanctions screening."""
-        from pathlib import Path
-        from ultra_search.core.file_output import (
-            FileOutputConfig,
-            OutputFormat,
-            write_result_to_file,
-        )
         from ultra_search.domains.risk_screening.providers import get_risk_provider
 
         provider = get_risk_provider("opensanctions", self.settings)
@@ -208,9 +269,66 @@ class ScreenSanctions(BaseTool[ScreenSanctionsInput, ScreenSanctionsOutput]):
 
         # File output
         if input_data.output_file:
-            format_str = input_data.output_format or Path(input_data.output_file).suffix.lstrip(".")
-            output_format = OutputFormat(format_str) if format_str in ["json", "md", "txt", "html"] else OutputFormat.JSON
+            output_format = resolve_output_format(input_data.output_file, input_data.output_format)
+            config = FileOutputConfig(path=input_data.output_file, format=output_format)
+            written_path = await write_result_to_file(output, config)
+            output.output_file_path = str(written_path)
 
+        return output
+
+
+@register_tool(domain="risk_screening")
+class ScreenSanctionsBatch(BaseTool[ScreenSanctionsBatchInput, ScreenSanctionsBatchOutput]):
+    """Screen a list of entities against sanctions and watchlists.
+
+    Screens every name concurrently (bounded by `concurrency`) using the
+    same checks as screen_sanctions. Useful for vetting a whole carrier
+    fleet or vendor list in one call.
+    """
+
+    name: ClassVar[str] = "screen_sanctions_batch"
+    description: ClassVar[str] = (
+        "Screen many entities against sanctions, watchlists, and PEP databases at once. "
+        "Runs screenings concurrently and returns one result per entity. "
+        "Use for fleet or vendor-list vetting."
+    )
+    domain: ClassVar[str] = "risk_screening"
+    input_model: ClassVar[type[BaseModel]] = ScreenSanctionsBatchInput
+    output_model: ClassVar[type[BaseModel]] = ScreenSanctionsBatchOutput
+
+    async def execute(self, input_data: ScreenSanctionsBatchInput) -> ScreenSanctionsBatchOutput:
+        """Execute batch sanctions screening."""
+        from ultra_search.domains.risk_screening.providers import get_risk_provider
+
+        provider = get_risk_provider("opensanctions", self.settings)
+
+        screenings = await provider.screen_entities_batch(
+            entity_names=input_data.entity_names,
+            entity_type=input_data.entity_type,
+            countries=input_data.countries,
+            fuzzy=input_data.fuzzy_matching,
+            concurrency=input_data.concurrency,
+        )
+
+        results = []
+        failed_entities = []
+        for entity_name, screening in zip(input_data.entity_names, screenings, strict=True):
+            if isinstance(screening, BaseException):
+                failed_entities.append(entity_name)
+            else:
+                results.append(screening)
+
+        output = ScreenSanctionsBatchOutput(
+            results=results,
+            total_screened=len(input_data.entity_names),
+            entities_with_matches=sum(1 for r in results if r.total_matches > 0),
+            failed_entities=failed_entities,
+            output_file_path=None,
+        )
+
+        # File output
+        if input_data.output_file:
+            output_format = resolve_output_format(input_data.output_file, input_data.output_format)
             config = FileOutputConfig(path=input_data.output_file, format=output_format)
             written_path = await write_result_to_file(output, config)
             output.output_file_path = str(written_path)
@@ -246,12 +364,6 @@ class SearchAdverseMedia(BaseTool[SearchAdverseMediaInput, SearchAdverseMediaOut
 
     async def execute(self, input_data: SearchAdverseMediaInput) -> SearchAdverseMediaOutput:
         """Execute adverse media search."""
-        from pathlib import Path
-        from ultra_search.core.file_output import (
-            FileOutputConfig,
-            OutputFormat,
-            write_result_to_file,
-        )
         from ultra_search.domains.risk_screening.providers import get_risk_provider
 
         provider = get_risk_provider("newsapi", self.settings)
@@ -270,9 +382,7 @@ class SearchAdverseMedia(BaseTool[SearchAdverseMediaInput, SearchAdverseMediaOut
 
         # File output
         if input_data.output_file:
-            format_str = input_data.output_format or Path(input_data.output_file).suffix.lstrip(".")
-            output_format = OutputFormat(format_str) if format_str in ["json", "md", "txt", "html"] else OutputFormat.JSON
-
+            output_format = resolve_output_format(input_data.output_file, input_data.output_format)
             config = FileOutputConfig(path=input_data.output_file, format=output_format)
             written_path = await write_result_to_file(output, config)
             output.output_file_path = str(written_path)
@@ -307,50 +417,34 @@ class MonitorEntityRisk(BaseTool[MonitorEntityRiskInput, MonitorEntityRiskOutput
 
     async def execute(self, input_data: MonitorEntityRiskInput) -> MonitorEntityRiskOutput:
         """Execute comprehensive risk monitoring."""
-        import asyncio
-        from pathlib import Path
-        from ultra_search.core.file_output import (
-            FileOutputConfig,
-            OutputFormat,
-            write_result_to_file,
-        )
         from ultra_search.domains.risk_screening.providers import get_risk_provider
 
-        # Run checks in parallel
-        tasks = []
-        sanctions_result = None
-        adverse_result = None
-
         if input_data.check_sanctions:
             sanctions_provider = get_risk_provider("opensanctions", self.settings)
-            tasks.append(
-                sanctions_provider.screen_entity(
-                    entity_name=input_data.entity_name,
-                    entity_type=input_data.entity_type,
-                )
+            sanctions_call = sanctions_provider.screen_entity(
+                entity_name=input_data.entity_name,
+                entity_type=input_data.entity_type,
             )
+        else:
+            sanctions_call = asyncio.sleep(0)  # Skipped check; resolves to None
 
         if input_data.check_adverse_media:
             news_provider = get_risk_provider("newsapi", self.settings)
-            tasks.append(
-                news_provider.search_adverse_media(
-                    entity_name=input_data.entity_name,
-                    keywords=["fraud", "scam", "lawsuit", "hostage", "complaint"],
-                )
+            adverse_call = news_provider.search_adverse_media(
+                entity_name=input_data.entity_name,
+                keywords=["fraud", "scam", "lawsuit", "hostage", "complaint"],
             )
+        else:
+            adverse_call = asyncio.sleep(0)
 
-        # Execute in parallel
-        if tasks:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            if input_data.check_sanctions and len(results) > 0:
-                if not isinstance(results[0], Exception):
-                    sanctions_result = results[0]
-
-            if input_data.check_adverse_media:
-                adverse_idx = 1 if input_data.check_sanctions else 0
-                if len(results) > adverse_idx and not isinstance(results[adverse_idx], Exception):
-                    adverse_result = results[adverse_idx]
+        # Run checks in parallel; a failed check leaves its result as None
+        sanctions_result, adverse_result = await asyncio.gather(
+            sanctions_call, adverse_call, return_exceptions=True
+        )
+        if isinstance(sanctions_result, BaseException):
+            sanctions_result = None
+        if isinstance(adverse_result, BaseException):
+            adverse_result = None
 
         # Calculate overall risk
         overall_risk_score = 0.0
@@ -359,9 +453,7 @@ class MonitorEntityRisk(BaseTool[MonitorEntityRiskInput, MonitorEntityRiskOutput
         if sanctions_result:
             if sanctions_result.total_matches > 0:
                 overall_risk_score += 50.0
-                risk_factors.append(
-                    f"Found on {sanctions_result.total_matches} watchlist(s)"
-                )
+                risk_factors.append(f"Found on {sanctions_result.total_matches} watchlist(s)")
 
         if adverse_result:
             overall_risk_score += adverse_result.adverse_media_score * 0.5
@@ -371,14 +463,9 @@ class MonitorEntityRisk(BaseTool[MonitorEntityRiskInput, MonitorEntityRiskOutput
                 risk_factors.append(f"{adverse_result.lawsuit_mentions} lawsuit mentions")
 
         # Determine risk level
-        if overall_risk_score >= 75:
-            risk_level = "critical"
-        elif overall_risk_score >= 50:
-            risk_level = "high"
-        elif overall_risk_score >= 25:
-            risk_level = "medium"
-        elif overall_risk_score > 0:
-            risk_level = "low"
+        if overall_risk_score > 0:
+            band = bisect_right(OVERALL_RISK_THRESHOLDS, overall_risk_score)
+            risk_level = OVERALL_RISK_LABELS[band]
         else:
             risk_level = "clear"
 
@@ -400,9 +487,7 @@ class MonitorEntityRisk(BaseTool[MonitorEntityRiskInput, MonitorEntityRiskOutput
 
         # File output
         if input_data.output_file:
-            format_str = input_data.output_format or Path(input_data.output_file).suffix.lstrip(".")
-            output_format = OutputFormat(format_str) if format_str in ["json", "md", "txt", "html"] else OutputFormat.JSON
-
+            output_format = resolve_output_format(input_data.output_file, input_data.output_format)
             config = FileOutputConfig(path=input_data.output_file, format=output_format)
             written_path = await write_result_to_file(output, config)
             output.output_file_path = str(written_path)
@@ -2,17 +2,46 @@
 
 from __future__ import annotations
 
+import asyncio
+from functools import cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ultra_search.core.config import Settings
 
 from ultra_search.core.base import BaseProvider
+from ultra_search.core.registry import register_shutdown_hook
+
+# Provider instances keyed by (provider_name, id(settings)) so each keeps its
+# HTTP client and connection pool across tool calls. Entries hold the settings
+# object too: that keeps its id from being reused by a reloaded Settings, and
+# hits are confirmed by identity.
+_PROVIDER_CACHE: dict[tuple[str, int], tuple[Settings, BaseProvider]] = {}
+
+
+@cache
+def _get_provider_class(provider_name: str) -> type[BaseProvider]:
+    """Resolve a provider class, importing its module on first use."""
+    if provider_name == "opensanctions":
+        from ultra_search.domains.risk_screening.providers.opensanctions import (
+            OpenSanctionsProvider,
+        )
+        return OpenSanctionsProvider
+    if provider_name == "newsapi":
+        from ultra_search.domains.risk_screening.providers.newsapi import NewsAPIProvider
+        return NewsAPIProvider
+
+    raise ValueError(
+        f"Unknown risk screening provider: {provider_name}. "
+        f"Available: opensanctions, newsapi"
+    )
 
 
 def get_risk_provider(provider_name: str, settings: "Settings") -> BaseProvider:
     """Get a risk screening provider instance.
 
+    Instances are cached per settings object and reused across calls.
+
     Args:
         provider_name: Name of provider (opensanctions, newsapi, gdelt)
         settings: Application settings
@@ -20,26 +49,31 @@ def get_risk_provider(provider_name: str, settings: "Settings") -> BaseProvider:
     Returns:
         Initialized provider instance
     """
-    providers = {}
+    cache_key = (provider_name, id(settings))
+    cached = _PROVIDER_CACHE.get(cache_key)
+    if cached is not None and cached[0] is settings:
+        return cached[1]
 
-    if provider_name == "opensanctions":
-        from ultra_search.domains.risk_screening.providers.opensanctions import (
-            OpenSanctionsProvider,
-        )
-        providers["opensanctions"] = OpenSanctionsProvider
-    elif provider_name == "newsapi":
-        from ultra_search.domains.risk_screening.providers.newsapi import NewsAPIProvider
-        providers["newsapi"] = NewsAPIProvider
+    provider_cls = _get_provider_class(provider_name)
+    api_key = settings.get_api_key(provider_name, domain="risk_screening")
 
-    if provider_name not in providers:
-        raise ValueError(
-            f"Unknown risk screening provider: {provider_name}. "
-            f"Available: opensanctions, newsapi"
-        )
+    # Provider-specific options come from the provider's "extra" settings
+    domain_cfg = settings.domains.get("risk_screening")
+    provider_cfg = domain_cfg.providers.get(provider_name) if domain_cfg else None
+    options = provider_cfg.extra if provider_cfg else {}
 
-    provider_cls = providers[provider_name]
-    api_key = settings.get_api_key(provider_name, domain="risk_screening")
-    return provider_cls(api_key=api_key)
+    provider = provider_cls(api_key=api_key, **options)
+    _PROVIDER_CACHE[cache_key] = (settings, provider)
+
+    return provider
+
+
+@register_shutdown_hook
+async def close_risk_providers() -> None:
+    """Close and forget all cached provider instances."""
+    providers = [provider for _, provider in _PROVIDER_CACHE.values()]
+    _PROVIDER_CACHE.clear()
+    await asyncio.gather(*(provider.close() for provider in providers))
 
 
-__all__ = ["get_risk_provider"]
+__all__ = ["get_risk_provider", "close_risk_providers"]
@@ -11,15 +11,81 @@ Alternative: GDELT Doc API (completely free, no key required)
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+import re
+import time
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 import httpx
+import orjson
 
 from ultra_search.core.base import BaseProvider
 from ultra_search.core.models import SearchResult, ResultType
 from ultra_search.domains.risk_screening.domain import AdverseMediaResult
 
+# Adverse-media categories in bit order, with the score each flagged article adds
+ADVERSE_CATEGORY_WEIGHTS = (
+    ("fraud", 15),
+    ("scam", 20),
+    ("lawsuit", 10),
+    ("investigation", 25),
+)
+
+# Adverse-media keywords and the classification bucket each one counts toward
+ADVERSE_KEYWORD_CATEGORIES = {
+    "fraud": "fraud",
+    "scam": "scam",
+    "hostage": "scam",
+    "lawsuit": "lawsuit",
+    "litigation": "lawsuit",
+    "investigation": "investigation",
+    "probe": "investigation",
+}
+
+# Whole words (plus plurals) only, so e.g. "probed" or "defrauded" don't match;
+# one pass over each article finds every keyword
+_ADVERSE_RE = re.compile(
+    r"\b(" + "|".join(ADVERSE_KEYWORD_CATEGORIES) + r")s?\b",
+    re.IGNORECASE,
+)
+
+# Keyword -> its category's bit, so an article's categories fold into one int mask
+_CATEGORY_BITS = {name: 1 << i for i, (name, _) in enumerate(ADVERSE_CATEGORY_WEIGHTS)}
+_KEYWORD_BITS = {
+    keyword: _CATEGORY_BITS[category] for keyword, category in ADVERSE_KEYWORD_CATEGORIES.items()
+}
+
+# Look-back window per date_range value; unknown values fall back to a year
+DATE_RANGE_DELTAS = {
+    "past_week": timedelta(days=7),
+    "past_month": timedelta(days=30),
+    "past_year": timedelta(days=365),
+}
+DEFAULT_DATE_RANGE_DELTA = DATE_RANGE_DELTAS["past_year"]
+
+# Adverse-media results are reused for repeat queries within this window (seconds)
+ADVERSE_MEDIA_TTL = 3600.0
+
+# Shared read-only default for an absent article "source" object
+_NO_SOURCE: MappingProxyType[str, Any] = MappingProxyType({})
+
+DEFAULT_ADVERSE_KEYWORDS = ("fraud", "scam", "lawsuit", "investigation", "complaint")
+
+
+@lru_cache(maxsize=8)
+def _from_date(range_str: str, minute_bucket: int) -> str:
+    """Format the start date for a range; minute_bucket only expires the cache."""
+    delta = DATE_RANGE_DELTAS.get(range_str, DEFAULT_DATE_RANGE_DELTA)
+    return (datetime.now(UTC) - delta).strftime("%Y-%m-%d")
+
+
+@lru_cache(maxsize=64)
+def _keyword_query(keywords: tuple[str, ...]) -> str:
+    """Join keywords into a NewsAPI OR clause (callers reuse a few keyword sets)."""
+    return " OR ".join(keywords)
+
 
 class NewsAPIProvider(BaseProvider):
     """NewsAPI provider for adverse media monitoring.
@@ -46,7 +112,9 @@ class NewsAPIProvider(BaseProvider):
 
             self._client = httpx.AsyncClient(
                 base_url=self.base_url,
+                http2=True,
                 timeout=httpx.Timeout(30.0),
+                limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60.0),
             )
         return self._client
 
@@ -66,7 +134,7 @@ class NewsAPIProvider(BaseProvider):
 
         response = await client.request(method, endpoint, **kwargs)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     async def search_adverse_media(
         self,
@@ -87,11 +155,11 @@ class NewsAPIProvider(BaseProvider):
             Adverse media results with classification
         """
         if keywords is None:
-            keywords = ["fraud", "scam", "lawsuit", "investigation", "complaint"]
+            keywords = list(DEFAULT_ADVERSE_KEYWORDS)
 
         # Build search query
         # Example: "ABC Moving" AND (fraud OR scam OR lawsuit OR complaint)
-        keyword_query = " OR ".join(keywords)
+        keyword_query = _keyword_query(tuple(keywords))
         query = f'"{entity_name}" AND ({keyword_query})'
 
         # Date range
@@ -105,25 +173,20 @@ class NewsAPIProvider(BaseProvider):
             "language": "en",
         }
 
-        # Search everything endpoint
-        data = await self._make_request("GET", "/everything", params=params)
-
-        return self._parse_adverse_media(entity_name, data, keywords, date_range)
+        # Search everything endpoint; repeat searches with the same query and
+        # options are answered from the response cache. The key uses the exact
+        # q parameter sent, so a cached result always belongs to this query.
+        cache_key = f"newsapi:adverse:{query}|{date_range}|{params['pageSize']}"
 
-    def _calculate_date_range(self, range_str: str) -> str:
-        """Calculate from_date based on range string."""
-        now = datetime.utcnow()
+        async def fetch() -> AdverseMediaResult:
+            data = await self._make_request("GET", "/everything", params=params)
+            return self._parse_adverse_media(entity_name, data, keywords, date_range)
 
-        if range_str == "past_week":
-            from_date = now - timedelta(days=7)
-        elif range_str == "past_month":
-            from_date = now - timedelta(days=30)
-        elif range_str == "past_year":
-            from_date = now - timedelta(days=365)
-        else:
-            from_date = now - timedelta(days=365)
+        return await self._cached_request(cache_key, ADVERSE_MEDIA_TTL, fetch)
 
-        return from_date.strftime("%Y-%m-%d")
+    def _calculate_date_range(self, range_str: str) -> str:
+        """Calculate from_date based on range string (recomputed once a minute)."""
+        return _from_date(range_str, int(time.time()) // 60)
 
     def _parse_adverse_media(
         self,
@@ -133,65 +196,63 @@ class NewsAPIProvider(BaseProvider):
         date_range: str,
     ) -> AdverseMediaResult:
         """Parse NewsAPI response and classify adverse media."""
-        articles_data = data.get("articles", [])
+        articles_data = data.get("articles", ())
         total = data.get("totalResults", len(articles_data))
 
         articles: list[SearchResult] = []
-        fraud_count = 0
-        scam_count = 0
-        lawsuit_count = 0
-        investigation_count = 0
+        category_counts = [0] * len(ADVERSE_CATEGORY_WEIGHTS)
 
         for article in articles_data:
-            title = article.get("title", "")
-            description = article.get("description", "")
-            content = article.get("content", "")
-            full_text = f"{title} {description} {content}".lower()
-
-            # Classify
-            if "fraud" in full_text:
-                fraud_count += 1
-            if "scam" in full_text or "hostage" in full_text:
-                scam_count += 1
-            if "lawsuit" in full_text or "litigation" in full_text:
-                lawsuit_count += 1
-            if "investigation" in full_text or "probe" in full_text:
-                investigation_count += 1
-
-            # Parse publish date
+            title = article.get("title") or ""
+            description = article.get("description") or ""
+            content = article.get("content") or ""
+
+            # Classify: each category counts once per article that mentions it
+            mask = 0
+            for keyword in _ADVERSE_RE.findall(f"{title} {description} {content}"):
+                mask |= _KEYWORD_BITS[keyword.lower()]
+            if mask:
+                for i in range(len(category_counts)):
+                    category_counts[i] += (mask >> i) & 1
+
+            # Parse publish date (fromisoformat accepts the trailing "Z")
             published = None
-            if article.get("publishedAt"):
+            if ts := article.get("publishedAt"):
                 try:
-                    published = datetime.fromisoformat(
-                        article["publishedAt"].replace("Z", "+00:00")
-                    )
-                except Exception:
+                    published = datetime.fromisoformat(ts)
+                except (ValueError, TypeError):
                     pass
 
+            # Fields come straight from the parsed response, so skip validation
             articles.append(
-                SearchResult(
+                SearchResult.model_construct(
                     title=title,
-                    url=article.get("url", ""),
-                    snippet=description or "",
+                    url=article.get("url") or "",
+                    snippet=description,
                     content=content,
                     result_type=ResultType.NEWS_ARTICLE,
                     source=self.provider_name,
                     published_date=published,
                     metadata={
-                        "source_name": article.get("source", {}).get("name"),
+                        "source_name": (article.get("source") or _NO_SOURCE).get("name"),
                         "author": article.get("author"),
                     },
                 )
             )
 
+        fraud_count, scam_count, lawsuit_count, investigation_count = category_counts
+
         # Calculate adverse media score (0-100)
-        score = 0.0
-        score += fraud_count * 15
-        score += scam_count * 20
-        score += lawsuit_count * 10
-        score += investigation_count * 25
+        score = float(
+            sum(
+                count * weight
+                for count, (_, weight) in zip(
+                    category_counts, ADVERSE_CATEGORY_WEIGHTS, strict=True
+                )
+            )
+        )
 
-        return AdverseMediaResult(
+        return AdverseMediaResult.model_construct(
             query=entity_name,
             total_articles=total,
             articles=articles,
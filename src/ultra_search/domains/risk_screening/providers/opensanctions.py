@@ -18,16 +18,59 @@ Coverage:
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+from bisect import bisect_left
+from difflib import SequenceMatcher
+from itertools import chain
+from types import MappingProxyType
+from typing import Any, ClassVar
 
 import httpx
+import orjson
 
 from ultra_search.core.base import BaseProvider
 from ultra_search.domains.risk_screening.domain import (
     SanctionsMatch,
     SanctionsScreeningResult,
+    normalize_entity_name,
 )
 
+# Match-score cutoffs: a score strictly above the i-th threshold earns label i + 1
+SANCTIONS_RISK_THRESHOLDS = (0.5, 0.7, 0.9)
+SANCTIONS_RISK_LABELS = ("clear", "low", "medium", "high")
+
+# Screening results are reused for repeat queries within this window (seconds)
+SCREENING_TTL = 3600.0
+
+# Shared read-only defaults for absent response fields, so the parse loop
+# doesn't allocate a fresh empty dict/list per missing key
+_NO_PROPERTIES: MappingProxyType[str, Any] = MappingProxyType({})
+_NO_VALUES: tuple[str, ...] = ()
+
+# Default minimum token-set similarity (0-100) between the query and a hit's
+# best name/alias for the hit to be kept under fuzzy matching. 0 keeps every
+# server-matched hit: dropping hits in a sanctions screen risks false
+# negatives, so filtering is opt-in, e.g.
+# ULTRA_DOMAINS__RISK_SCREENING__PROVIDERS__OPENSANCTIONS__EXTRA__MIN_NAME_SIMILARITY=60
+DEFAULT_MIN_NAME_SIMILARITY = 0.0
+
+
+def _token_set_ratio(a: str, b: str) -> float:
+    """Token-set similarity (0-100) of two normalized names.
+
+    Compares the shared tokens against each side's full token set, so word
+    order and extra words on one side (e.g. "LLC") do not sink the score.
+    """
+    tokens_a, tokens_b = set(a.split()), set(b.split())
+    common = " ".join(sorted(tokens_a & tokens_b))
+    full_a = f"{common} {' '.join(sorted(tokens_a - tokens_b))}".strip()
+    full_b = f"{common} {' '.join(sorted(tokens_b - tokens_a))}".strip()
+
+    pairs = [(full_a, full_b)]
+    if common:
+        pairs += [(common, full_a), (common, full_b)]
+    return 100.0 * max(SequenceMatcher(None, x, y).ratio() for x, y in pairs)
+
 
 class OpenSanctionsProvider(BaseProvider):
     """OpenSanctions API provider.
@@ -42,6 +85,31 @@ class OpenSanctionsProvider(BaseProvider):
     base_url = "https://api.opensanctions.org"
     requires_auth = True  # Now requires API key (but free tier available!)
 
+    # entity_type values accepted by the tools, mapped to OpenSanctions schemas
+    _SCHEMA_MAP: ClassVar[dict[str, str]] = {
+        "organization": "Company",
+        "person": "Person",
+        "vessel": "Vessel",
+    }
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        min_name_similarity: float | str = DEFAULT_MIN_NAME_SIMILARITY,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize provider.
+
+        Args:
+            api_key: OpenSanctions API key
+            min_name_similarity: Fuzzy hits whose best name/alias scores below
+                this similarity (0-100) to the query are dropped; 0 disables
+                the filter
+            **kwargs: Additional provider configuration
+        """
+        super().__init__(api_key=api_key, **kwargs)
+        self.min_name_similarity = float(min_name_similarity)
+
     async def get_client(self) -> httpx.AsyncClient:
         """Get HTTP client with API key authentication."""
         if self._client is None:
@@ -59,7 +127,9 @@ class OpenSanctionsProvider(BaseProvider):
                     "Accept": "application/json",
                     "User-Agent": "UltraSearch/1.0 (Research Tool)",
                 },
+                http2=True,
                 timeout=httpx.Timeout(30.0),
+                limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60.0),
             )
         return self._client
 
@@ -73,7 +143,7 @@ class OpenSanctionsProvider(BaseProvider):
         client = await self.get_client()
         response = await client.request(method, endpoint, **kwargs)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     async def screen_entity(
         self,
@@ -96,7 +166,7 @@ class OpenSanctionsProvider(BaseProvider):
         # Build query params
         params = {
             "q": entity_name,
-            "schema": entity_type if entity_type != "organization" else "Company",
+            "schema": self._SCHEMA_MAP.get(entity_type, entity_type),
             "limit": 50,
         }
 
@@ -106,53 +176,115 @@ class OpenSanctionsProvider(BaseProvider):
         if not fuzzy:
             params["fuzzy"] = "false"
 
-        # Search OpenSanctions
-        data = await self._make_request("GET", "/search/default", params=params)
+        # Search OpenSanctions; repeat screenings with the same query params
+        # are answered from the response cache. The key is built from exactly
+        # what is sent, so a cached result always belongs to this query.
+        cache_key = f"opensanctions:screen:{sorted(params.items())}"
+
+        async def fetch() -> SanctionsScreeningResult:
+            data = await self._make_request("GET", "/search/default", params=params)
+            return self._parse_results(entity_name, data, fuzzy=fuzzy)
+
+        return await self._cached_request(cache_key, SCREENING_TTL, fetch)
+
+    async def screen_entities_batch(
+        self,
+        entity_names: list[str],
+        entity_type: str = "organization",
+        countries: list[str] | None = None,
+        fuzzy: bool = True,
+        concurrency: int = 10,
+    ) -> list[SanctionsScreeningResult | BaseException]:
+        """Screen many entities concurrently.
+
+        OpenSanctions counts each search as one request, so entities are
+        fanned out as individual screenings with at most `concurrency`
+        in flight at once.
+
+        Args:
+            entity_names: Names to screen
+            entity_type: organization, person, or vessel
+            countries: Optional country filters
+            fuzzy: Enable fuzzy matching
+            concurrency: Maximum simultaneous requests
+
+        Returns:
+            One result per name, in input order; failed screenings are
+            returned as the exception raised
+        """
+        semaphore = asyncio.Semaphore(concurrency)
 
-        return self._parse_results(entity_name, data)
+        async def screen_one(name: str) -> SanctionsScreeningResult:
+            async with semaphore:
+                return await self.screen_entity(name, entity_type, countries, fuzzy)
+
+        return await asyncio.gather(
+            *(screen_one(name) for name in entity_names),
+            return_exceptions=True,
+        )
 
     def _parse_results(
         self,
         query_name: str,
         data: dict[str, Any],
+        fuzzy: bool = False,
     ) -> SanctionsScreeningResult:
-        """Parse OpenSanctions API response."""
-        results = data.get("results", [])
+        """Parse OpenSanctions API response.
+
+        With fuzzy matching, hits are rescored locally against the query
+        (recorded as name_similarity) and, if min_name_similarity is set,
+        those scoring below it are dropped.
+        """
+        results = data.get("results", _NO_VALUES)
+        normalized_query = normalize_entity_name(query_name)
 
         matches: list[SanctionsMatch] = []
-        datasets_found = set()
+        highest_score = 0.0
 
         for result in results:
             # Extract entity data
-            properties = result.get("properties", {})
-            score = result.get("score", 0.0)
+            properties = result.get("properties") or _NO_PROPERTIES
 
             # Get all names/aliases
-            names = properties.get("name", [])
-            aliases = properties.get("alias", [])
-            all_names = names + aliases
+            names = properties.get("name", _NO_VALUES)
+            all_names = [*names, *properties.get("alias", _NO_VALUES)]
+
+            # Rescore on the best-matching name or alias
+            if fuzzy:
+                similarity = max(
+                    (
+                        _token_set_ratio(normalized_query, normalize_entity_name(name))
+                        for name in all_names
+                    ),
+                    default=0.0,
+                )
+                if similarity < self.min_name_similarity:
+                    continue
+                result = {**result, "name_similarity": round(similarity, 1)}
+
+            score = float(result.get("score") or 0.0)
+            highest_score = max(highest_score, score)
 
             # Get countries
-            countries = properties.get("country", [])
+            countries = properties.get("country") or []
 
             # Get datasets this entity appears in
-            datasets = result.get("datasets", [])
-            for ds in datasets:
-                datasets_found.add(ds)
+            datasets = result.get("datasets", _NO_VALUES)
 
             # Primary name
             primary_name = names[0] if names else query_name
 
             # Sanction reason
-            reason = properties.get("reason", [])
+            reason = properties.get("reason", _NO_VALUES)
             reason_text = reason[0] if reason else None
 
             # Listed date
-            listed_dates = properties.get("listedAt", [])
+            listed_dates = properties.get("listedAt", _NO_VALUES)
             listed_date = listed_dates[0] if listed_dates else None
 
+            # Fields come straight from the parsed response, so skip validation
             matches.append(
-                SanctionsMatch(
+                SanctionsMatch.model_construct(
                     entity_name=primary_name,
                     match_score=score,
                     dataset=", ".join(datasets),
@@ -165,25 +297,22 @@ class OpenSanctionsProvider(BaseProvider):
                 )
             )
 
-        # Calculate highest match score
-        highest_score = max([m.match_score for m in matches], default=0.0)
+        # Datasets across kept matches, first-seen order
+        datasets_found = list(
+            dict.fromkeys(
+                chain.from_iterable(m.metadata.get("datasets", _NO_VALUES) for m in matches)
+            )
+        )
 
-        # Determine risk level
-        if highest_score > 0.9:
-            risk_level = "high"
-        elif highest_score > 0.7:
-            risk_level = "medium"
-        elif highest_score > 0.5:
-            risk_level = "low"
-        else:
-            risk_level = "clear"
+        # Determine risk level (bisect_left keeps the cutoffs exclusive)
+        risk_level = SANCTIONS_RISK_LABELS[bisect_left(SANCTIONS_RISK_THRESHOLDS, highest_score)]
 
-        return SanctionsScreeningResult(
+        return SanctionsScreeningResult.model_construct(
             query_name=query_name,
             total_matches=len(matches),
             matches=matches,
             highest_match_score=highest_score,
             risk_level=risk_level,
             provider=self.provider_name,
-            screened_datasets=list(datasets_found),
+            screened_datasets=datasets_found,
         )
@@ -2,13 +2,41 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import Any, ClassVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 from ultra_search.core.base import BaseTool
-from ultra_search.core.models import SearchResponse, SearchResult, ResultType
+from ultra_search.core.file_output import (
+    FileOutputConfig,
+    OutputFormat,
+    write_result_to_file,
+)
+from ultra_search.core.models import SearchResponse, SearchResult
 from ultra_search.core.registry import register_tool
+from ultra_search.domains.web_search.providers import BaseSearchProvider, get_search_provider
+
+
+def _normalize_query(query: str) -> str:
+    """Strip surrounding whitespace, rejecting queries left empty."""
+    query = query.strip()
+    if not query:
+        raise ValueError("query must not be empty")
+    return query
+
+
+def _get_provider(settings: Any) -> BaseSearchProvider:
+    """Get the configured search provider.
+
+    The provider instance (and its result cache) lives in
+    get_search_provider's per-settings cache, not on the tool, so every tool
+    sharing the settings shares it.
+    """
+    domain_cfg = settings.domains.get("web_search")
+    provider_name = domain_cfg.default_provider if domain_cfg else "mock"
+
+    return get_search_provider(provider_name, settings)
 
 
 class SearchWebInput(BaseModel):
@@ -26,6 +54,11 @@ class SearchWebInput(BaseModel):
         description="Output format override (json, md, txt, html). Auto-detected from file extension if not specified."
     )
 
+    @field_validator("query")
+    @classmethod
+    def _strip_query(cls, query: str) -> str:
+        return _normalize_query(query)
+
 
 class SearchWebOutput(BaseModel):
     """Output from web search."""
@@ -65,22 +98,16 @@ class SearchWeb(BaseTool[SearchWebInput, SearchWebOutput]):
         Returns:
             Search results from the configured provider
         """
-        from pathlib import Path
-        from ultra_search.core.file_output import (
-            FileOutputConfig,
-            OutputFormat,
-            write_result_to_file,
-        )
-
         # Get provider based on settings
-        provider = await self._get_provider()
-        results = await provider.search(
+        provider = _get_provider(self.settings)
+        results = await provider.cached_search(
             query=input_data.query,
             num_results=input_data.num_results,
             search_type=input_data.search_type,
         )
 
-        output = SearchWebOutput(
+        # Every field is produced here, so skip validation
+        output = SearchWebOutput.model_construct(
             query=input_data.query,
             results=results,
             total_results=len(results),
@@ -116,15 +143,6 @@ class SearchWeb(BaseTool[SearchWebInput, SearchWebOutput]):
 
         return output
 
-    async def _get_provider(self) -> Any:
-        """Get the appropriate search provider based on settings."""
-        from ultra_search.domains.web_search.providers import get_search_provider
-
-        domain_cfg = self.settings.domains.get("web_search")
-        provider_name = domain_cfg.default_provider if domain_cfg else "mock"
-
-        return get_search_provider(provider_name, self.settings)
-
 
 class SearchNewsInput(BaseModel):
     """Input for news search."""
@@ -133,6 +151,11 @@ class SearchNewsInput(BaseModel):
     num_results: int = Field(default=10, ge=1, le=50, description="Number of results")
     freshness: str = Field(default="week", description="Time range: day, week, month")
 
+    @field_validator("query")
+    @classmethod
+    def _strip_query(cls, query: str) -> str:
+        return _normalize_query(query)
+
 
 class SearchNewsOutput(BaseModel):
     """Output from news search."""
@@ -157,23 +180,16 @@ class SearchNews(BaseTool[SearchNewsInput, SearchNewsOutput]):
 
     async def execute(self, input_data: SearchNewsInput) -> SearchNewsOutput:
         """Execute news search."""
-        from ultra_search.domains.web_search.providers import get_search_provider
+        provider = _get_provider(self.settings)
 
-        domain_cfg = self.settings.domains.get("web_search")
-        provider_name = domain_cfg.default_provider if domain_cfg else "mock"
-        provider = get_search_provider(provider_name, self.settings)
-
-        results = await provider.search(
+        results = await provider.cached_search(
             query=input_data.query,
             num_results=input_data.num_results,
             search_type="news",
         )
 
-        # Mark results as news articles
-        for result in results:
-            result.result_type = ResultType.NEWS_ARTICLE
-
-        return SearchNewsOutput(
+        # Every provider already marks search_type="news" results as news articles
+        return SearchNewsOutput.model_construct(
             query=input_data.query,
             results=results,
             provider=provider.provider_name,
@@ -2,18 +2,58 @@
 
 from __future__ import annotations
 
+import asyncio
+from functools import cache
+from importlib import import_module
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ultra_search.core.config import Settings
 
-from ultra_search.domains.web_search.providers.base import BaseSearchProvider
+from ultra_search.core.registry import register_shutdown_hook
+from ultra_search.domains.web_search.providers.base import (
+    BaseSearchProvider,
+    ProviderResponseError,
+    close_shared_client,
+)
 from ultra_search.domains.web_search.providers.mock import MockSearchProvider
 
+# Provider name -> "module:class"; modules other than mock are imported on
+# first use so optional providers cost nothing until selected
+_PROVIDER_PATHS = {
+    "mock": "ultra_search.domains.web_search.providers.mock:MockSearchProvider",
+    "serpapi": "ultra_search.domains.web_search.providers.serpapi:SerpAPIProvider",
+    "tavily": "ultra_search.domains.web_search.providers.tavily:TavilyProvider",
+    "brave": "ultra_search.domains.web_search.providers.brave:BraveSearchProvider",
+    "parallel": "ultra_search.domains.web_search.providers.parallel:ParallelSearchProvider",
+}
+
+# Provider instances keyed by (provider_name, id(settings)) so tool calls
+# reuse them instead of constructing a provider per search. Entries hold the
+# settings object too: that keeps its id from being reused by a reloaded
+# Settings, and hits are confirmed by identity.
+_PROVIDER_CACHE: dict[tuple[str, int], tuple[Settings, BaseSearchProvider]] = {}
+
+
+@cache
+def _get_provider_class(provider_name: str) -> type[BaseSearchProvider]:
+    """Resolve a provider class, importing its module on first use."""
+    path = _PROVIDER_PATHS.get(provider_name)
+    if path is None:
+        raise ValueError(
+            f"Unknown search provider: {provider_name}. "
+            f"Available: {list(_PROVIDER_PATHS)}"
+        )
+
+    module_name, class_name = path.split(":")
+    return getattr(import_module(module_name), class_name)
+
 
 def get_search_provider(provider_name: str, settings: "Settings") -> BaseSearchProvider:
     """Get a search provider instance by name.
 
+    Instances are cached per settings object and reused across calls.
+
     Args:
         provider_name: Name of the provider (serpapi, tavily, brave, parallel, mock)
         settings: Application settings for API keys
@@ -21,38 +61,40 @@ def get_search_provider(provider_name: str, settings: "Settings") -> BaseSearchP
     Returns:
         Initialized provider instance
     """
-    providers = {
-        "mock": MockSearchProvider,
-    }
-
-    # Lazy import optional providers
-    if provider_name == "serpapi":
-        from ultra_search.domains.web_search.providers.serpapi import SerpAPIProvider
-        providers["serpapi"] = SerpAPIProvider
-    elif provider_name == "tavily":
-        from ultra_search.domains.web_search.providers.tavily import TavilyProvider
-        providers["tavily"] = TavilyProvider
-    elif provider_name == "brave":
-        from ultra_search.domains.web_search.providers.brave import BraveSearchProvider
-        providers["brave"] = BraveSearchProvider
-    elif provider_name == "parallel":
-        from ultra_search.domains.web_search.providers.parallel import ParallelSearchProvider
-        providers["parallel"] = ParallelSearchProvider
-
-    if provider_name not in providers:
-        raise ValueError(
-            f"Unknown search provider: {provider_name}. "
-            f"Available: {list(providers.keys())}"
-        )
+    cache_key = (provider_name, id(settings))
+    cached = _PROVIDER_CACHE.get(cache_key)
+    if cached is not None and cached[0] is settings:
+        return cached[1]
 
-    provider_cls = providers[provider_name]
+    provider_cls = _get_provider_class(provider_name)
     api_key = settings.get_api_key(provider_name, domain="web_search")
 
-    return provider_cls(api_key=api_key)
+    # Optional result cache lifetime, e.g.
+    # ULTRA_DOMAINS__WEB_SEARCH__PROVIDERS__BRAVE__EXTRA__CACHE_TTL=30
+    cache_ttl = None
+    domain_cfg = settings.domains.get("web_search")
+    if domain_cfg and provider_name in domain_cfg.providers:
+        ttl = domain_cfg.providers[provider_name].extra.get("cache_ttl")
+        cache_ttl = float(ttl) if ttl is not None else None
+
+    provider = provider_cls(api_key=api_key, cache_ttl=cache_ttl)
+    _PROVIDER_CACHE[cache_key] = (settings, provider)
+    return provider
+
+
+@register_shutdown_hook
+async def close_web_search_providers() -> None:
+    """Close and forget all cached provider instances and the shared client."""
+    providers = [provider for _, provider in _PROVIDER_CACHE.values()]
+    _PROVIDER_CACHE.clear()
+    await asyncio.gather(*(provider.close() for provider in providers))
+    await close_shared_client()
 
 
 __all__ = [
     "BaseSearchProvider",
     "MockSearchProvider",
+    "ProviderResponseError",
     "get_search_provider",
+    "close_web_search_providers",
 ]
@@ -2,38 +2,206 @@
 
 from __future__ import annotations
 
+import asyncio
+import copy
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import Callable
+from typing import Any, ClassVar, TypeVar
 
 import httpx
+import orjson
 
+from ultra_search.core.base import CachedRequestMixin
 from ultra_search.core.models import SearchResult
 
+ParsedT = TypeVar("ParsedT")
 
-class BaseSearchProvider(ABC):
+# Response cache lifetimes (seconds) per search type; news goes stale fastest
+DEFAULT_SEARCH_CACHE_TTL = 60.0
+SEARCH_CACHE_TTLS = {"news": 10.0}
+
+# Largest response body a provider may return (bytes); bigger bodies are
+# abandoned before they are fully downloaded or parsed
+MAX_RESPONSE_BYTES = 8 * 1024 * 1024
+
+# Bodies at least this large (bytes) are decoded and parsed in a worker
+# thread, so one big payload doesn't stall other requests on the event loop
+OFFLOAD_PARSE_BYTES = 64 * 1024
+
+# One HTTP client shared by every search provider instance, so connections
+# (and their TLS sessions) are pooled across providers and tool calls.
+# Providers pass absolute URLs, so the client carries no base_url.
+_SHARED_CLIENT: httpx.AsyncClient | None = None
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Get or create the HTTP client shared by all search providers.
+
+    Creation never yields to the event loop, so concurrent callers cannot
+    race to build two clients.
+    """
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is None or _SHARED_CLIENT.is_closed:
+        # HTTP/2 multiplexes concurrent searches to the same provider over one
+        # connection. Pool settings live on the transport: httpx ignores the
+        # client's http2/limits arguments when a transport is given.
+        _SHARED_CLIENT = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0, connect=10.0),
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=2,  # connection failures only; HTTP errors are not retried
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=50,
+                    keepalive_expiry=90.0,
+                ),
+            ),
+        )
+    return _SHARED_CLIENT
+
+
+async def close_shared_client() -> None:
+    """Close the shared HTTP client; the next request opens a new one."""
+    global _SHARED_CLIENT
+    client, _SHARED_CLIENT = _SHARED_CLIENT, None
+    if client is not None:
+        await client.aclose()
+
+
+class ProviderResponseError(ValueError):
+    """A provider returned a successful status with an unusable body.
+
+    Raised for non-JSON responses (e.g. an HTML captcha page) and for
+    bodies larger than MAX_RESPONSE_BYTES.
+    """
+
+
+class BaseSearchProvider(CachedRequestMixin, ABC):
     """Abstract base class for web search providers."""
 
     provider_name: str = "base"
     base_url: str = ""
     requires_auth: bool = True
 
-    def __init__(self, api_key: str | None = None, **kwargs: Any) -> None:
+    # Most upstream requests a provider class keeps in flight at once, across
+    # all instances; None means unlimited. Keeps fan-out under provider rate
+    # limits instead of tripping 429s.
+    max_concurrency: ClassVar[int | None] = None
+
+    # (event loop, semaphore) enforcing max_concurrency, created per class
+    _concurrency_limit: ClassVar[tuple[asyncio.AbstractEventLoop, asyncio.Semaphore] | None]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._concurrency_limit = None
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        cache_ttl: float | None = None,
+        **kwargs: Any,
+    ) -> None:
         """Initialize provider.
 
         Args:
             api_key: API key for authentication
+            cache_ttl: Seconds to cache search results, overriding the
+                per-search-type defaults; 0 disables caching
             **kwargs: Additional provider configuration
         """
+        super().__init__()
         self.api_key = api_key
-        self._client: httpx.AsyncClient | None = None
+        self.cache_ttl = cache_ttl
 
     async def get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._client is None:
-            self._client = httpx.AsyncClient(
-                timeout=httpx.Timeout(30.0, connect=10.0),
-            )
-        return self._client
+        """Get the shared HTTP client."""
+        return get_shared_client()
+
+    async def _request_json(
+        self,
+        method: str,
+        url: str,
+        parse: Callable[[Any], ParsedT],
+        **kwargs: Any,
+    ) -> ParsedT:
+        """Send a request, decode its JSON body and parse it.
+
+        The response is streamed so headers can be checked before the body
+        is read: error statuses raise httpx.HTTPStatusError, and non-JSON or
+        oversized bodies raise ProviderResponseError without being parsed.
+        Bodies of OFFLOAD_PARSE_BYTES or more are decoded and parsed in a
+        worker thread, so parse must not touch the event loop. At most
+        max_concurrency requests per provider class run at once.
+
+        Args:
+            method: HTTP method
+            url: Absolute request URL
+            parse: Converts the decoded JSON into the caller's result
+            **kwargs: Request arguments (params, headers, content, ...)
+
+        Returns:
+            Parsed result
+        """
+        semaphore = self._get_semaphore()
+        if semaphore is None:
+            return await self._send_json(method, url, parse, **kwargs)
+        async with semaphore:
+            return await self._send_json(method, url, parse, **kwargs)
+
+    @classmethod
+    def _get_semaphore(cls) -> asyncio.Semaphore | None:
+        """Get the class's concurrency semaphore for the running loop."""
+        if cls.max_concurrency is None:
+            return None
+
+        loop = asyncio.get_running_loop()
+        limit = cls._concurrency_limit
+        if limit is None or limit[0] is not loop:
+            limit = (loop, asyncio.Semaphore(cls.max_concurrency))
+            cls._concurrency_limit = limit
+        return limit[1]
+
+    async def _send_json(
+        self,
+        method: str,
+        url: str,
+        parse: Callable[[Any], ParsedT],
+        **kwargs: Any,
+    ) -> ParsedT:
+        """Send one request for _request_json (see there)."""
+        client = await self.get_client()
+        request = client.build_request(method, url, **kwargs)
+        response = await client.send(request, stream=True)
+        try:
+            response.raise_for_status()
+
+            content_type = response.headers.get("content-type", "")
+            if content_type and "json" not in content_type:
+                raise ProviderResponseError(
+                    f"{self.provider_name} returned {content_type!r}, expected JSON"
+                )
+
+            declared = response.headers.get("content-length")
+            if declared is not None and int(declared) > MAX_RESPONSE_BYTES:
+                raise ProviderResponseError(
+                    f"{self.provider_name} response of {declared} bytes exceeds "
+                    f"{MAX_RESPONSE_BYTES}"
+                )
+
+            # Content-Length may be absent (chunked) or wrong; enforce while reading
+            body = bytearray()
+            async for chunk in response.aiter_bytes():
+                body += chunk
+                if len(body) > MAX_RESPONSE_BYTES:
+                    raise ProviderResponseError(
+                        f"{self.provider_name} response exceeds {MAX_RESPONSE_BYTES} bytes"
+                    )
+        finally:
+            await response.aclose()
+
+        if len(body) >= OFFLOAD_PARSE_BYTES:
+            return await asyncio.to_thread(lambda: parse(orjson.loads(body)))
+        return parse(orjson.loads(body))
 
     @abstractmethod
     async def search(
@@ -56,11 +224,51 @@ class BaseSearchProvider(ABC):
         """
         pass
 
+    async def cached_search(
+        self,
+        query: str,
+        num_results: int = 10,
+        search_type: str = "web",
+        **kwargs: Any,
+    ) -> list[SearchResult]:
+        """Perform a search through the response cache.
+
+        Repeat calls within the cache TTL are answered from memory, and
+        concurrent misses with identical arguments await a single upstream
+        search. Each caller gets its own deep copy of the results, so one
+        caller mutating them does not affect the others or the cache.
+
+        Args:
+            query: Search query
+            num_results: Number of results to return
+            search_type: Type of search (web, news, images)
+            **kwargs: Additional search parameters
+
+        Returns:
+            List of search results
+        """
+        # Search engines ignore case and surrounding whitespace, so "Foo " and
+        # "foo" share a cache entry
+        key = (search_type, query.strip().lower(), num_results, tuple(sorted(kwargs.items())))
+
+        ttl = self.cache_ttl
+        if ttl is None:
+            ttl = SEARCH_CACHE_TTLS.get(search_type, DEFAULT_SEARCH_CACHE_TTL)
+
+        return await self._cached_request(
+            key,
+            ttl,
+            lambda: self.search(query, num_results=num_results, search_type=search_type, **kwargs),
+            copy_result=copy.deepcopy,
+        )
+
     async def close(self) -> None:
-        """Close the HTTP client."""
-        if self._client is not None:
-            await self._client.aclose()
-            self._client = None
+        """Drop cached responses.
+
+        The HTTP client is shared between providers and is closed once via
+        close_shared_client(), not per provider.
+        """
+        self._response_cache.clear()
 
     async def __aenter__(self) -> "BaseSearchProvider":
         return self
@@ -6,11 +6,20 @@ Docs: https://brave.com/search/api/
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable
 from typing import Any
 
 from ultra_search.core.models import SearchResult, ResultType
 from ultra_search.domains.web_search.providers.base import BaseSearchProvider
 
+# Most results Brave returns per request, by search type; larger requests
+# are split into pages (Brave's offset counts pages of this size)
+PAGE_SIZES = {"web": 20, "news": 50}
+
+# Item fields copied into result metadata when present
+_BRAVE_META_KEYS = ("age", "language", "family_friendly")
+
 
 class BraveSearchProvider(BaseSearchProvider):
     """Brave Search API provider.
@@ -24,6 +33,17 @@ class BraveSearchProvider(BaseSearchProvider):
     provider_name = "brave"
     base_url = "https://api.search.brave.com/res/v1"
     requires_auth = True
+    max_concurrency = 2
+
+    def __init__(self, api_key: str | None = None, **kwargs: Any) -> None:
+        """Initialize provider, building the per-request URLs and headers once."""
+        super().__init__(api_key=api_key, **kwargs)
+        self._web_url = f"{self.base_url}/web/search"
+        self._news_url = f"{self.base_url}/news/search"
+        self._headers = {
+            "X-Subscription-Token": api_key or "",
+            "Accept": "application/json",
+        }
 
     async def search(
         self,
@@ -45,59 +65,69 @@ class BraveSearchProvider(BaseSearchProvider):
         if not self.api_key:
             raise ValueError("Brave Search requires an API key. Set ULTRA_BRAVE_API_KEY.")
 
-        client = await self.get_client()
-
-        # Determine endpoint
-        endpoint = "/news/search" if search_type == "news" else "/web/search"
-
-        params = {
-            "q": query,
-            "count": num_results,
-        }
-        params.update(kwargs)
-
-        headers = {
-            "X-Subscription-Token": self.api_key,
-            "Accept": "application/json",
-        }
-
-        response = await client.get(
-            f"{self.base_url}{endpoint}",
-            params=params,
-            headers=headers,
-        )
-        response.raise_for_status()
-        data = response.json()
-
-        return self._parse_results(data, search_type)
-
-    def _parse_results(self, data: dict[str, Any], search_type: str) -> list[SearchResult]:
-        """Parse Brave Search response into SearchResult objects."""
-        results = []
-
-        # Get results based on search type
+        # Pick the endpoint and its parser once for the whole search
         if search_type == "news":
-            items = data.get("results", [])
+            url, parse = self._news_url, self._parse_news
         else:
-            web_data = data.get("web", {})
-            items = web_data.get("results", [])
-
-        for item in items:
-            result_type = ResultType.NEWS_ARTICLE if search_type == "news" else ResultType.WEB_PAGE
-
-            results.append(
-                SearchResult(
-                    title=item.get("title", ""),
-                    url=item.get("url", ""),
-                    snippet=item.get("description", ""),
-                    result_type=result_type,
-                    source=self.provider_name,
-                    metadata={
-                        "age": item.get("age"),
-                        "language": item.get("language"),
-                        "family_friendly": item.get("family_friendly"),
-                    },
+            url, parse = self._web_url, self._parse_web
+
+        page_size = PAGE_SIZES.get(search_type, PAGE_SIZES["web"])
+        if num_results <= page_size or "offset" in kwargs:
+            params = {
+                "q": query,
+                "count": num_results,
+            }
+            params.update(kwargs)
+            return await self._fetch_page(url, params, parse)
+
+        # Fetch every page at once; they share the HTTP/2 connection, so
+        # this takes about as long as a single page
+        pages = await asyncio.gather(
+            *(
+                self._fetch_page(
+                    url,
+                    {"q": query, "count": page_size, "offset": page, **kwargs},
+                    parse,
                 )
+                for page in range(-(-num_results // page_size))
             )
+        )
+        return [result for page in pages for result in page][:num_results]
+
+    async def _fetch_page(
+        self,
+        url: str,
+        params: dict[str, Any],
+        parse: Callable[[dict[str, Any]], list[SearchResult]],
+    ) -> list[SearchResult]:
+        """Fetch and parse one page of results."""
+        return await self._request_json("GET", url, parse, params=params, headers=self._headers)
+
+    def _parse_web(self, data: dict[str, Any]) -> list[SearchResult]:
+        """Parse a Brave web search response (results under "web")."""
+        return self._build_results(data.get("web", {}).get("results", []), ResultType.WEB_PAGE)
+
+    def _parse_news(self, data: dict[str, Any]) -> list[SearchResult]:
+        """Parse a Brave news search response (results at the top level)."""
+        return self._build_results(data.get("results", []), ResultType.NEWS_ARTICLE)
 
-        return results
+    def _build_results(
+        self,
+        items: list[dict[str, Any]],
+        result_type: ResultType,
+    ) -> list[SearchResult]:
+        """Convert Brave result items into SearchResult objects."""
+        source = self.provider_name
+
+        # Fields come straight from the parsed response, so skip validation
+        return [
+            SearchResult.model_construct(
+                title=item.get("title", ""),
+                url=item.get("url", ""),
+                snippet=item.get("description", ""),
+                result_type=result_type,
+                source=source,
+                metadata={k: v for k in _BRAVE_META_KEYS if (v := item.get(k)) is not None},
+            )
+            for item in items
+        ]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from typing import Any
+from urllib.parse import quote_plus
 
 from ultra_search.core.models import SearchResult, ResultType
 from ultra_search.domains.web_search.providers.base import BaseSearchProvider
@@ -38,26 +39,30 @@ class MockSearchProvider(BaseSearchProvider):
         Returns:
             List of mock search results
         """
-        results = []
-
-        for i in range(min(num_results, 5)):
-            result_type = ResultType.NEWS_ARTICLE if search_type == "news" else ResultType.WEB_PAGE
-
-            results.append(
-                SearchResult(
-                    title=f"Mock Result {i + 1}: {query}",
-                    url=f"https://example.com/result/{i + 1}?q={query.replace(' ', '+')}",
-                    snippet=f"This is a mock search result for '{query}'. "
-                            f"In production, this would contain real content from {self.provider_name}.",
-                    result_type=result_type,
-                    source=self.provider_name,
-                    relevance_score=1.0 - (i * 0.1),
-                    metadata={
-                        "mock": True,
-                        "position": i + 1,
-                        "search_type": search_type,
-                    },
-                )
-            )
+        result_type = ResultType.NEWS_ARTICLE if search_type == "news" else ResultType.WEB_PAGE
+        source = self.provider_name
+
+        # Shared by every result, so built once
+        encoded_query = quote_plus(query)
+        snippet = (
+            f"This is a mock search result for '{query}'. "
+            f"In production, this would contain real content from {source}."
+        )
 
-        return results
+        # Fields are built here, so skip validation
+        return [
+            SearchResult.model_construct(
+                title=f"Mock Result {i + 1}: {query}",
+                url=f"https://example.com/result/{i + 1}?q={encoded_query}",
+                snippet=snippet,
+                result_type=result_type,
+                source=source,
+                relevance_score=max(1.0 - (i * 0.1), 0.0),
+                metadata={
+                    "mock": True,
+                    "position": i + 1,
+                    "search_type": search_type,
+                },
+            )
+            for i in range(num_results)
+        ]
@@ -6,11 +6,34 @@ Docs: https://serpapi.com/search-api
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable
 from typing import Any
 
 from ultra_search.core.models import SearchResult, ResultType
 from ultra_search.domains.web_search.providers.base import BaseSearchProvider
 
+# SerpAPI engine for each search type; anything else searches Google web
+SEARCH_ENGINES = {
+    "web": "google",
+    "news": "google_news",
+    "images": "google_images",
+}
+
+# Response key holding the result list for each search type
+RESULTS_KEYS = {
+    "web": "organic_results",
+    "news": "news_results",
+    "images": "images_results",
+}
+
+# Google web results per SerpAPI request; larger web searches are split into
+# pages fetched concurrently (news and image results are not paginated here)
+WEB_PAGE_SIZE = 10
+
+# Item fields copied into result metadata when present
+_SERPAPI_META_KEYS = ("position", "displayed_link", "thumbnail")
+
 
 class SerpAPIProvider(BaseSearchProvider):
     """SerpAPI Google Search provider.
@@ -22,6 +45,17 @@ class SerpAPIProvider(BaseSearchProvider):
     provider_name = "serpapi"
     base_url = "https://serpapi.com"
     requires_auth = True
+    max_concurrency = 5
+
+    def __init__(self, api_key: str | None = None, **kwargs: Any) -> None:
+        """Initialize provider, building the search URL once."""
+        super().__init__(api_key=api_key, **kwargs)
+        self._search_url = f"{self.base_url}/search"
+        self._parsers = {
+            "web": self._parse_web,
+            "news": self._parse_news,
+            "images": self._parse_images,
+        }
 
     async def search(
         self,
@@ -43,58 +77,70 @@ class SerpAPIProvider(BaseSearchProvider):
         if not self.api_key:
             raise ValueError("SerpAPI requires an API key. Set ULTRA_SERPAPI_API_KEY.")
 
-        client = await self.get_client()
-
-        # Map search type to SerpAPI engine
-        engine_map = {
-            "web": "google",
-            "news": "google_news",
-            "images": "google_images",
-        }
-        engine = engine_map.get(search_type, "google")
-
+        # json_restrictor has SerpAPI drop everything but the result list
+        # (ads, knowledge graph, related searches...) before sending
         params = {
             "api_key": self.api_key,
-            "engine": engine,
+            "engine": SEARCH_ENGINES.get(search_type, "google"),
             "q": query,
             "num": num_results,
+            "json_restrictor": RESULTS_KEYS.get(search_type, "organic_results"),
         }
         params.update(kwargs)
 
-        response = await client.get(f"{self.base_url}/search", params=params)
-        response.raise_for_status()
-        data = response.json()
-
-        return self._parse_results(data, search_type)
-
-    def _parse_results(self, data: dict[str, Any], search_type: str) -> list[SearchResult]:
-        """Parse SerpAPI response into SearchResult objects."""
-        results = []
-
-        # Handle different result types
-        if search_type == "news":
-            items = data.get("news_results", [])
-        elif search_type == "images":
-            items = data.get("images_results", [])
-        else:
-            items = data.get("organic_results", [])
-
-        for item in items:
-            result_type = ResultType.NEWS_ARTICLE if search_type == "news" else ResultType.WEB_PAGE
-
-            results.append(
-                SearchResult(
-                    title=item.get("title", ""),
-                    url=item.get("link", item.get("original", "")),
-                    snippet=item.get("snippet", item.get("source", "")),
-                    result_type=result_type,
-                    source=self.provider_name,
-                    metadata={
-                        "position": item.get("position"),
-                        "displayed_link": item.get("displayed_link"),
-                        "thumbnail": item.get("thumbnail"),
-                    },
-                )
+        # Pick the parser once for the whole search
+        parse = self._parsers.get(search_type, self._parse_web)
+
+        if search_type != "web" or num_results <= WEB_PAGE_SIZE or "start" in kwargs:
+            return await self._fetch_page(params, parse)
+
+        # Fetch every page at once; they share the HTTP/2 connection, so
+        # this takes about as long as a single page
+        pages = await asyncio.gather(
+            *(
+                self._fetch_page({**params, "num": WEB_PAGE_SIZE, "start": start}, parse)
+                for start in range(0, num_results, WEB_PAGE_SIZE)
             )
+        )
+        return [result for page in pages for result in page][:num_results]
 
-        return results
+    async def _fetch_page(
+        self,
+        params: dict[str, Any],
+        parse: Callable[[dict[str, Any]], list[SearchResult]],
+    ) -> list[SearchResult]:
+        """Fetch and parse one page of results."""
+        return await self._request_json("GET", self._search_url, parse, params=params)
+
+    def _parse_web(self, data: dict[str, Any]) -> list[SearchResult]:
+        """Parse a Google web search response."""
+        return self._build_results(data.get("organic_results", []), ResultType.WEB_PAGE)
+
+    def _parse_news(self, data: dict[str, Any]) -> list[SearchResult]:
+        """Parse a Google News search response."""
+        return self._build_results(data.get("news_results", []), ResultType.NEWS_ARTICLE)
+
+    def _parse_images(self, data: dict[str, Any]) -> list[SearchResult]:
+        """Parse a Google Images search response."""
+        return self._build_results(data.get("images_results", []), ResultType.WEB_PAGE)
+
+    def _build_results(
+        self,
+        items: list[dict[str, Any]],
+        result_type: ResultType,
+    ) -> list[SearchResult]:
+        """Convert SerpAPI result items into SearchResult objects."""
+        source = self.provider_name
+
+        # Fields come straight from the parsed response, so skip validation
+        return [
+            SearchResult.model_construct(
+                title=item.get("title", ""),
+                url=item.get("link", item.get("original", "")),
+                snippet=item.get("snippet", item.get("source", "")),
+                result_type=result_type,
+                source=source,
+                metadata={k: v for k in _SERPAPI_META_KEYS if (v := item.get(k)) is not None},
+            )
+            for item in items
+        ]
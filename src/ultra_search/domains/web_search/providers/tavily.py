@@ -8,9 +8,22 @@ from __future__ import annotations
 
 from typing import Any
 
+import orjson
+
 from ultra_search.core.models import SearchResult, ResultType
 from ultra_search.domains.web_search.providers.base import BaseSearchProvider
 
+# Tavily topic for each search type; anything else is a general search
+SEARCH_TOPICS = {
+    "web": "general",
+    "news": "news",
+}
+
+# Result type for each search type; anything else is a web page
+RESULT_TYPES = {
+    "news": ResultType.NEWS_ARTICLE,
+}
+
 
 class TavilyProvider(BaseSearchProvider):
     """Tavily AI-powered search provider.
@@ -25,6 +38,12 @@ class TavilyProvider(BaseSearchProvider):
     base_url = "https://api.tavily.com"
     requires_auth = True
 
+    def __init__(self, api_key: str | None = None, **kwargs: Any) -> None:
+        """Initialize provider, building the search URL and headers once."""
+        super().__init__(api_key=api_key, **kwargs)
+        self._search_url = f"{self.base_url}/search"
+        self._headers = {"Content-Type": "application/json"}
+
     async def search(
         self,
         query: str,
@@ -45,50 +64,41 @@ class TavilyProvider(BaseSearchProvider):
         if not self.api_key:
             raise ValueError("Tavily requires an API key. Set ULTRA_TAVILY_API_KEY.")
 
-        client = await self.get_client()
-
-        # Map search type to Tavily topic
-        topic_map = {
-            "web": "general",
-            "news": "news",
-        }
-        topic = topic_map.get(search_type, "general")
-
         payload = {
             "api_key": self.api_key,
             "query": query,
             "max_results": num_results,
-            "topic": topic,
+            "topic": SEARCH_TOPICS.get(search_type, "general"),
             "include_answer": kwargs.get("include_answer", False),
             "include_raw_content": kwargs.get("include_raw_content", False),
         }
 
-        response = await client.post(f"{self.base_url}/search", json=payload)
-        response.raise_for_status()
-        data = response.json()
-
-        return self._parse_results(data, search_type)
+        # Streamed over the shared HTTP/2 client; the body is size- and
+        # content-type-checked before it is decoded
+        return await self._request_json(
+            "POST",
+            self._search_url,
+            lambda data: self._parse_results(data, search_type),
+            content=orjson.dumps(payload),
+            headers=self._headers,
+        )
 
     def _parse_results(self, data: dict[str, Any], search_type: str) -> list[SearchResult]:
         """Parse Tavily response into SearchResult objects."""
-        results = []
-
-        for item in data.get("results", []):
-            result_type = ResultType.NEWS_ARTICLE if search_type == "news" else ResultType.WEB_PAGE
-
-            results.append(
-                SearchResult(
-                    title=item.get("title", ""),
-                    url=item.get("url", ""),
-                    snippet=item.get("content", ""),
-                    content=item.get("raw_content"),
-                    result_type=result_type,
-                    source=self.provider_name,
-                    relevance_score=item.get("score"),
-                    metadata={
-                        "published_date": item.get("published_date"),
-                    },
-                )
+        result_type = RESULT_TYPES.get(search_type, ResultType.WEB_PAGE)
+        source = self.provider_name
+
+        # Fields come straight from the parsed response, so skip validation
+        return [
+            SearchResult.model_construct(
+                title=item.get("title", ""),
+                url=item.get("url", ""),
+                snippet=item.get("content", ""),
+                content=item.get("raw_content"),
+                result_type=result_type,
+                source=source,
+                relevance_score=item.get("score"),
+                metadata={"published_date": item.get("published_date")},
             )
-
-        return results
+            for item in data.get("results", ())
+        ]
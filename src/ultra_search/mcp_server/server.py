@@ -7,16 +7,19 @@ Tools are dynamically discovered from the domains package.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Any
 
+import orjson
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import TextContent, Tool
 
 from ultra_search.core.config import Settings, get_settings
-from ultra_search.core.registry import discover_domains, get_tools
+from ultra_search.core.registry import discover_domains, get_tools, run_shutdown_hooks
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -25,6 +28,36 @@ logger = logging.getLogger(__name__)
 # Create server instance
 server = Server("ultra-search")
 
+# Input schemas depend only on the tool class, so each is generated once
+_SCHEMA_CACHE: dict[type, dict[str, Any]] = {}
+
+
+@dataclass
+class _ToolState:
+    """Tool lookups derived from one settings object, built once and reused."""
+
+    settings: Settings
+    tools: Mapping[str, type]  # Read-only: shared by every request
+    available: str  # "Available: [...]" text of unknown-tool errors
+    instances: dict[str, Any] = field(default_factory=dict)
+    mcp_tools: list[Tool] | None = None
+
+
+# State for the current settings. It is matched by identity, not id(): a
+# reloaded Settings can reuse the id of a collected one.
+_TOOL_STATE: _ToolState | None = None
+
+
+def _get_tool_state(settings: Settings) -> _ToolState:
+    """Get the tool state for settings, rebuilding it after reload_settings()."""
+    global _TOOL_STATE
+    state = _TOOL_STATE
+    if state is None or state.settings is not settings:
+        tools = MappingProxyType(get_tools(settings.get_enabled_domains()))
+        state = _ToolState(settings=settings, tools=tools, available=str(list(tools)))
+        _TOOL_STATE = state
+    return state
+
 
 def get_tool_schema(tool_cls: type) -> dict[str, Any]:
     """Get JSON schema for a tool's input model.
@@ -35,9 +68,14 @@ def get_tool_schema(tool_cls: type) -> dict[str, Any]:
     Returns:
         JSON schema dictionary
     """
-    if hasattr(tool_cls, "input_model"):
-        return tool_cls.input_model.model_json_schema()
-    return {"type": "object", "properties": {}}
+    schema = _SCHEMA_CACHE.get(tool_cls)
+    if schema is None:
+        if hasattr(tool_cls, "input_model"):
+            schema = tool_cls.input_model.model_json_schema()
+        else:
+            schema = {"type": "object", "properties": {}}
+        _SCHEMA_CACHE[tool_cls] = schema
+    return schema
 
 
 @server.list_tools()
@@ -48,12 +86,19 @@ async def list_tools() -> list[Tool]:
     1. Which domains are enabled in settings
     2. Which tools are registered in those domains
     """
-    settings = get_settings()
-    enabled_domains = settings.get_enabled_domains()
-    tools = get_tools(enabled_domains)
+    return list(_get_mcp_tools(get_settings()))
+
 
-    logger.info(f"Listing tools for domains: {enabled_domains}")
-    logger.info(f"Found {len(tools)} tools")
+def _get_mcp_tools(settings: Settings) -> list[Tool]:
+    """Build the MCP Tool list for the enabled tools, once per settings."""
+    state = _get_tool_state(settings)
+    if state.mcp_tools is not None:
+        return state.mcp_tools
+
+    tools = state.tools
+
+    logger.info("Listing tools for domains: %s", settings.get_enabled_domains())
+    logger.info("Found %d tools", len(tools))
 
     mcp_tools = []
     for name, tool_cls in tools.items():
@@ -66,8 +111,9 @@ async def list_tools() -> list[Tool]:
                 )
             )
         except Exception as e:
-            logger.error(f"Error creating tool schema for {name}: {e}")
+            logger.error("Error creating tool schema for %s: %s", name, e)
 
+    state.mcp_tools = mcp_tools
     return mcp_tools
 
 
@@ -83,65 +129,102 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
         List of TextContent with the tool result
     """
     settings = get_settings()
-    enabled_domains = settings.get_enabled_domains()
-    tools = get_tools(enabled_domains)
+    state = _get_tool_state(settings)
 
-    if name not in tools:
-        error_msg = f"Tool '{name}' not found or not enabled. Available: {list(tools.keys())}"
+    if name not in state.tools:
+        error_msg = f"Tool '{name}' not found or not enabled. Available: {state.available}"
         logger.error(error_msg)
-        return [TextContent(type="text", text=json.dumps({"error": error_msg}))]
+        return _error_content(error_msg)
 
     try:
-        tool_cls = tools[name]
-        tool = tool_cls(settings)
+        # Tools keep no per-call state, so one instance per settings is reused
+        tool = state.instances.get(name)
+        if tool is None:
+            tool = state.tools[name](settings)
+            state.instances[name] = tool
 
         # Validate and execute
-        validated_input = tool.input_model(**arguments)
+        validated_input = tool.input_model.model_validate(arguments)
         result = await tool.execute(validated_input)
 
-        # Serialize result
+        # Serialize result (models serialize natively in pydantic-core). The
+        # client parses it, so it is compact unless pretty_json is set.
+        pretty = settings.pretty_json
         if hasattr(result, "model_dump_json"):
-            result_json = result.model_dump_json(indent=2)
+            result_json = result.model_dump_json(indent=2 if pretty else None)
         else:
-            result_json = json.dumps(result, indent=2, default=str)
+            option = orjson.OPT_NON_STR_KEYS
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            result_json = orjson.dumps(result, default=str, option=option).decode()
 
-        logger.info(f"Tool '{name}' executed successfully")
-        return [TextContent(type="text", text=result_json)]
+        # Runs on every call; skip the logging machinery when INFO is off
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Tool '%s' executed successfully", name)
+        return [_text_content(result_json)]
 
     except Exception as e:
         error_msg = f"Error executing tool '{name}': {str(e)}"
         logger.error(error_msg, exc_info=True)
-        return [TextContent(type="text", text=json.dumps({"error": error_msg}))]
+        return _error_content(error_msg)
+
+
+def _error_content(error_msg: str) -> list[TextContent]:
+    """Wrap an error message as the JSON tool response."""
+    return [_text_content(orjson.dumps({"error": error_msg}).decode())]
+
+
+def _text_content(text: str) -> TextContent:
+    """Build a text content block for a tool response."""
+    # The type literal and our own JSON string are known valid, so skip validation
+    return TextContent.model_construct(type="text", text=text)
 
 
 async def serve() -> None:
     """Start the MCP server.
 
     This function:
-    1. Discovers all domain tools
+    1. Discovers all domain tools and builds their schemas
     2. Starts the stdio server for MCP communication
+    3. Runs registered shutdown hooks once the server stops
     """
     # Discover all domains and their tools
     discover_domains()
 
     settings = get_settings()
     enabled = settings.get_enabled_domains()
-    tools = get_tools(enabled)
+    tools = _get_tool_state(settings).tools
 
     logger.info("=" * 50)
     logger.info("Ultra Search MCP Server Starting")
-    logger.info(f"Enabled domains: {enabled}")
-    logger.info(f"Available tools: {list(tools.keys())}")
+    logger.info("Enabled domains: %s", enabled)
+    logger.info("Available tools: %s", list(tools))
     logger.info("=" * 50)
 
-    # Run the server
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(read_stream, write_stream, server.create_initialization_options())
+    # Generate every input schema now so the first list_tools is answered
+    # from cache
+    _get_mcp_tools(settings)
+
+    # Run the server; on stdio EOF or cancellation, close pooled provider clients
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(read_stream, write_stream, server.create_initialization_options())
+    finally:
+        await run_shutdown_hooks()
 
 
 def main() -> None:
-    """Entry point for the MCP server."""
-    asyncio.run(serve())
+    """Entry point for the MCP server.
+
+    Runs on uvloop when it is installed (the "fast" extra), otherwise on
+    the default asyncio event loop.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(serve())
+    else:
+        uvloop.run(serve())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,110 @@
+"""Tests for OpenSanctions fuzzy-match filtering."""
+
+from ultra_search.core.config import DomainConfig, ProviderConfig, Settings
+from ultra_search.domains.risk_screening.providers import get_risk_provider
+from ultra_search.domains.risk_screening.providers.opensanctions import OpenSanctionsProvider
+
+QUERY = "Vladimir Putin"
+
+RESPONSE = {
+    "results": [
+        # Transliterated spelling of the query
+        {
+            "schema": "Person",
+            "score": 0.92,
+            "datasets": ["us_ofac_sdn"],
+            "properties": {"name": ["Wladimir Putin"]},
+        },
+        # Primary name in another script; only an alias matches the query
+        {
+            "schema": "Person",
+            "score": 0.88,
+            "datasets": ["eu_fsf"],
+            "properties": {
+                "name": ["Путин Владимир"],
+                "alias": ["Vladimir Vladimirovich Putin"],
+            },
+        },
+        # Unrelated hit the server matched on a stray token
+        {
+            "schema": "Company",
+            "score": 0.51,
+            "datasets": ["gb_hmt_sanctions"],
+            "properties": {"name": ["Acme Shipping Holdings"]},
+        },
+    ]
+}
+
+
+def _names(result):
+    return [match.entity_name for match in result.matches]
+
+
+def test_threshold_keeps_transliterated_and_alias_hits_and_drops_junk():
+    provider = OpenSanctionsProvider(api_key="test", min_name_similarity=60)
+
+    result = provider._parse_results(QUERY, RESPONSE, fuzzy=True)
+
+    assert _names(result) == ["Wladimir Putin", "Путин Владимир"]
+    assert result.total_matches == 2
+    assert all(m.metadata["name_similarity"] >= 60 for m in result.matches)
+
+
+def test_filter_is_off_by_default():
+    provider = OpenSanctionsProvider(api_key="test")
+
+    result = provider._parse_results(QUERY, RESPONSE, fuzzy=True)
+
+    assert len(result.matches) == 3
+
+
+def test_zero_threshold_keeps_every_hit():
+    provider = OpenSanctionsProvider(api_key="test", min_name_similarity=0)
+
+    result = provider._parse_results(QUERY, RESPONSE, fuzzy=True)
+
+    assert len(result.matches) == 3
+
+
+def test_exact_matching_is_never_filtered():
+    provider = OpenSanctionsProvider(api_key="test", min_name_similarity=60)
+
+    result = provider._parse_results(QUERY, RESPONSE, fuzzy=False)
+
+    assert len(result.matches) == 3
+
+
+def test_threshold_read_from_provider_settings():
+    settings = Settings(
+        domains={
+            "risk_screening": DomainConfig(
+                providers={
+                    "opensanctions": ProviderConfig(extra={"min_name_similarity": "75"}),
+                },
+            ),
+        },
+    )
+
+    provider = get_risk_provider("opensanctions", settings)
+
+    assert provider.min_name_similarity == 75.0
+
+
+async def test_cache_does_not_share_results_between_spellings():
+    provider = OpenSanctionsProvider(api_key="test")
+    sent: list[str] = []
+
+    async def fake_request(method, endpoint, **kwargs):
+        sent.append(kwargs["params"]["q"])
+        return RESPONSE if kwargs["params"]["q"] == "Müller" else {"results": []}
+
+    provider._make_request = fake_request
+
+    umlaut = await provider.screen_entity("Müller")
+    plain = await provider.screen_entity("Muller")
+    again = await provider.screen_entity("Müller")
+
+    assert sent == ["Müller", "Muller"]
+    assert len(umlaut.matches) == 3
+    assert plain.matches == []
+    assert again is umlaut